@@ -4,10 +4,12 @@ from datetime import date, timedelta
 from flask import Flask, render_template, request, jsonify, send_from_directory
 import calendar
 import json
+import zlib
 
 import os
 import subprocess
 from digiman.config import FLASK_SECRET_KEY, FLASK_DEBUG
+from digiman.cron_history import read_history
 from digiman.models import Todo, init_db
 
 # Tag color palette (8 colors)
@@ -36,8 +38,24 @@ app.secret_key = FLASK_SECRET_KEY
 app.jinja_env.globals['tag_color'] = tag_color
 
 
+# Upper bound for a gzip request body once inflated
+MAX_INFLATED_BODY = 16 * 1024 * 1024
+
+
 def get_request_data():
-    """Get data from request, handling both JSON and form data."""
+    """Get data from request, handling both JSON and form data.
+
+    JSON bodies may be sent gzip-compressed (Content-Encoding: gzip).
+    """
+    if request.content_encoding == "gzip":
+        inflater = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        try:
+            body = inflater.decompress(request.get_data(), MAX_INFLATED_BODY)
+            if inflater.unconsumed_tail:
+                return {}  # larger than MAX_INFLATED_BODY
+            return json.loads(body)
+        except (zlib.error, ValueError):
+            return {}
     if request.is_json:
         return request.get_json(force=True, silent=True) or {}
     elif request.form:
@@ -152,10 +170,17 @@ def should_reject_suggestion(title: str, description: str = None) -> tuple[bool,
     return False, ""
 
 
+# Set once init_db() has succeeded in this process
+_db_ready = False
+
+
 @app.before_request
 def ensure_db():
-    """Ensure database is initialized before any request."""
-    init_db()
+    """Ensure database is initialized before the first request."""
+    global _db_ready
+    if not _db_ready:
+        init_db()
+        _db_ready = True
 
 
 @app.context_processor
@@ -323,10 +348,17 @@ def backlog_view():
 
 @app.route("/api/todos", methods=["GET"])
 def api_get_todos():
-    """Get all todos."""
-    status = request.args.get("status")
-    todos = Todo.get_all(status=status)
-    return jsonify([t.to_dict() for t in todos])
+    """Get all todos, optionally filtered by ?status= and ?due_date=.
+
+    Responses carry an ETag so unchanged lists come back as 304.
+    """
+    todos = Todo.get_all(
+        status=request.args.get("status"),
+        due_date=request.args.get("due_date"),
+    )
+    response = jsonify([t.to_dict() for t in todos])
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 @app.route("/api/todos", methods=["POST"])
@@ -642,14 +674,17 @@ def api_import_suggestions():
     rejected = 0
     rejection_reasons = {}
 
+    from digiman.models import ProcessedSource
+    processed = ProcessedSource.load_all()
+    newly_processed = []
+
     for item in suggestions_data:
         # Skip if already exists (by source_id)
         source_id = item.get("source_id")
-        if source_id:
-            from digiman.models import ProcessedSource
-            if ProcessedSource.is_processed(item.get("source_type", "manual"), source_id):
-                skipped += 1
-                continue
+        source_key = (item.get("source_type", "manual"), source_id)
+        if source_id and source_key in processed:
+            skipped += 1
+            continue
 
         # Filter out non-actionable suggestions
         title = item.get("title", "")
@@ -660,7 +695,8 @@ def api_import_suggestions():
             rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
             # Still mark as processed so we don't try again
             if source_id:
-                ProcessedSource.mark_processed(item.get("source_type", "manual"), source_id)
+                processed.add(source_key)
+                newly_processed.append(source_key)
             continue
 
         todo = Todo(
@@ -677,10 +713,14 @@ def api_import_suggestions():
 
         # Mark as processed to avoid re-import
         if source_id:
-            ProcessedSource.mark_processed(item.get("source_type", "manual"), source_id)
+            processed.add(source_key)
+            newly_processed.append(source_key)
 
         imported += 1
 
+    if newly_processed:
+        ProcessedSource.bulk_mark(newly_processed)
+
     return jsonify({
         "success": True,
         "imported": imported,
@@ -695,6 +735,31 @@ def api_import_suggestions():
 # In-memory status storage (will be replaced by database in production)
 _monitoring_status = {}
 
+# Parsed local cron status, keyed by the file's mtime
+_cron_status_cache = (None, {})
+
+
+def load_local_cron_status() -> dict:
+    """Read ~/.digiman/cron_status.json, re-parsing only when it changes."""
+    global _cron_status_cache
+    from pathlib import Path
+    status_file = Path.home() / ".digiman" / "cron_status.json"
+    try:
+        mtime = os.stat(status_file).st_mtime_ns
+    except OSError:
+        return {}
+
+    if mtime != _cron_status_cache[0]:
+        try:
+            status = json.loads(status_file.read_text())
+        except (json.JSONDecodeError, ValueError, OSError):
+            return {}
+        # Runs are appended to a sidecar just before the status file is written
+        status["history"] = read_history() or status.get("history", [])
+        _cron_status_cache = (mtime, status)
+    return _cron_status_cache[1].copy()
+
+
 @app.route("/status")
 def status_page():
     """System status dashboard (Monitoring tab)."""
@@ -705,13 +770,7 @@ def status_page():
 
     # Fallback to local file (for local development)
     if not cron_status:
-        from pathlib import Path
-        status_file = Path.home() / ".digiman" / "cron_status.json"
-        if status_file.exists():
-            try:
-                cron_status = json.loads(status_file.read_text())
-            except (json.JSONDecodeError, ValueError, OSError):
-                pass
+        cron_status = load_local_cron_status()
 
     return render_template("status.html", cron_status=cron_status, active_page="status")
 
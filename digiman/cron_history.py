@@ -0,0 +1,70 @@
+"""Append-only run history for the local cron jobs.
+
+Each run is one JSON line in ~/.digiman/cron_history.jsonl (oldest first),
+so recording a run is a single append instead of rewriting the whole
+history inside cron_status.json.
+"""
+
+import json
+from collections import deque
+from pathlib import Path
+
+try:
+    import orjson  # optional, faster JSON
+except ImportError:
+    orjson = None
+
+HISTORY_FILE = Path.home() / ".digiman" / "cron_history.jsonl"
+HISTORY_LIMIT = 50
+
+# Once the file grows past this it is rewritten with the last HISTORY_LIMIT runs
+HISTORY_MAX_BYTES = 64 * 1024
+
+
+def _dumps(obj) -> bytes:
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode("utf-8")
+
+
+def _loads(line: bytes):
+    return orjson.loads(line) if orjson else json.loads(line)
+
+
+def append_history(entry: dict, legacy: list = None, path: Path = HISTORY_FILE):
+    """Record one run.
+
+    legacy is the newest-first "history" list from an old cron_status.json;
+    it seeds the file the first time it is created.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = []
+    if legacy and not path.exists():
+        lines.extend(_dumps(e) + b"\n" for e in reversed(legacy[:HISTORY_LIMIT]))
+    lines.append(_dumps(entry) + b"\n")
+
+    with open(path, "ab") as f:
+        f.writelines(lines)
+        size = f.tell()
+
+    if size > HISTORY_MAX_BYTES:
+        with open(path, "rb") as f:
+            tail = deque(f, maxlen=HISTORY_LIMIT)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(b"".join(tail))
+        tmp.replace(path)
+
+
+def read_history(limit: int = HISTORY_LIMIT, path: Path = HISTORY_FILE) -> list:
+    """Return the last `limit` runs, newest first."""
+    try:
+        with open(path, "rb") as f:
+            tail = deque(f, maxlen=limit)
+    except OSError:
+        return []
+
+    history = []
+    for line in reversed(tail):
+        try:
+            history.append(_loads(line))
+        except ValueError:
+            continue  # skip a torn or hand-edited line
+    return history
@@ -128,15 +128,18 @@ class GranolaIngester:
         # Documents is a dict with doc_id as key
         documents = state.get("documents", {})
         panels = state.get("documentPanels", {})
+        if not documents:
+            return []
 
         # Calculate cutoff time
         cutoff = datetime.now() - timedelta(hours=hours)
 
         meetings = []
+        processed = ProcessedSource.load_all()
 
         for doc_id, doc in documents.items():
             # Skip if already processed
-            if ProcessedSource.is_processed("granola", doc_id):
+            if ("granola", doc_id) in processed:
                 continue
 
             # Check if within time window
@@ -27,6 +27,8 @@ class MeetingArchiveIngester:
         if not year_dir.exists():
             return []
 
+        processed = ProcessedSource.load_all()
+
         for filepath in year_dir.glob("*.md"):
             # Skip index files
             if filepath.name.startswith("_") or "INDEX" in filepath.name:
@@ -41,7 +43,7 @@ class MeetingArchiveIngester:
             source_id = f"archive_{filepath.stem}"
 
             # Skip if already processed
-            if ProcessedSource.is_processed("meeting_archive", source_id):
+            if ("meeting_archive", source_id) in processed:
                 continue
 
             # Parse the file
@@ -4,12 +4,46 @@ Uses bot token compatible APIs (conversations.list + conversations.history)
 instead of search.messages which requires a user token.
 """
 
+import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
 from digiman.config import SLACK_BOT_TOKEN, SLACK_USER_ID, SLACK_WORKSPACE
 from digiman.models import ProcessedSource
 
+# Slack markup rewritten by _clean_slack_text, as (pattern, replacement)
+_SLACK_MARKUP = [
+    # User mentions like <@U123>
+    (re.compile(r'<@[A-Z0-9]+>'), '@user'),
+    # Channel links
+    (re.compile(r'<#[A-Z0-9]+\|([^>]+)>'), r'#\1'),
+    # URL links with text
+    (re.compile(r'<(https?://[^|>]+)\|([^>]+)>'), r'\2'),
+    # Plain URLs
+    (re.compile(r'<(https?://[^>]+)>'), r'\1'),
+]
+
+# Generic phrases that are never action items
+_SKIP_RE = re.compile(
+    r'^(hi|hello|hey|thanks|thank you|ok|okay|sure|yes|no|np|sounds good)$', re.IGNORECASE
+)
+
+# Action patterns - things that look like requests/tasks
+_ACTION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # Direct requests with "can you", "could you", "please"
+    r'(?:can you|could you|would you|please)\s+(\S.{10,})',
+    # Action verbs directed at someone
+    r'(?:^|\s)(?:review|check|look at|update|fix|send|share|create|prepare|schedule|follow up|sync|coordinate|finalize|approve|submit|test|deploy|document|implement|add|remove|change|set up)\s+(\S.{5,})',
+    # Questions that imply action
+    r'(?:can we|should we|shall we)\s+(\S.{10,})',
+    # Deadline mentions
+    r'(.{10,})\s+(?:by|before|until)\s+(?:today|tomorrow|monday|tuesday|wednesday|thursday|friday|EOD|end of day|end of week)',
+    # Explicit task markers
+    r'(?:TODO|Action item|Task|Need to|Have to)[:.]?\s+(\S.{5,})',
+)]
+
+_LEADING_JUNK_RE = re.compile(r'^[?\-\s]+')
+
 
 class SlackIngester:
     """Fetch Slack @mentions using bot-compatible APIs."""
@@ -88,6 +122,7 @@ class SlackIngester:
             print(f"📢 Scanning {len(channels)} channels for mentions...")
 
             mention_pattern = f"<@{self.user_id}>"
+            processed = ProcessedSource.load_all()
 
             for channel in channels:
                 channel_id = channel["id"]
@@ -111,7 +146,7 @@ class SlackIngester:
                         msg_id = f"{channel_id}_{msg.get('ts', '')}"
 
                         # Skip if already processed
-                        if ProcessedSource.is_processed("slack", msg_id):
+                        if ("slack", msg_id) in processed:
                             continue
 
                         ts = float(msg.get("ts", 0))
@@ -284,15 +319,9 @@ class SlackIngester:
 
     def _clean_slack_text(self, text: str) -> str:
         """Clean Slack formatting from text."""
-        import re
-        # Remove user mentions like <@U123>
-        cleaned = re.sub(r'<@[A-Z0-9]+>', '@user', text)
-        # Convert channel links
-        cleaned = re.sub(r'<#[A-Z0-9]+\|([^>]+)>', r'#\1', cleaned)
-        # Convert URL links with text
-        cleaned = re.sub(r'<(https?://[^|>]+)\|([^>]+)>', r'\2', cleaned)
-        # Convert plain URLs
-        cleaned = re.sub(r'<(https?://[^>]+)>', r'\1', cleaned)
+        cleaned = text
+        for pattern, replacement in _SLACK_MARKUP:
+            cleaned = pattern.sub(replacement, cleaned)
         return cleaned
 
     def extract_action_items(self, context: str) -> List[str]:
@@ -300,30 +329,9 @@ class SlackIngester:
 
         Similar to Granola's extraction - no API needed.
         """
-        import re
-
         if not context:
             return []
 
-        # Skip these generic phrases
-        skip_patterns = [
-            r'^(hi|hello|hey|thanks|thank you|ok|okay|sure|yes|no|np|sounds good)$',
-        ]
-
-        # Action patterns - things that look like requests/tasks
-        action_patterns = [
-            # Direct requests with "can you", "could you", "please"
-            r'(?:can you|could you|would you|please)\s+(\S.{10,})',
-            # Action verbs directed at someone
-            r'(?:^|\s)(?:review|check|look at|update|fix|send|share|create|prepare|schedule|follow up|sync|coordinate|finalize|approve|submit|test|deploy|document|implement|add|remove|change|set up)\s+(\S.{5,})',
-            # Questions that imply action
-            r'(?:can we|should we|shall we)\s+(\S.{10,})',
-            # Deadline mentions
-            r'(.{10,})\s+(?:by|before|until)\s+(?:today|tomorrow|monday|tuesday|wednesday|thursday|friday|EOD|end of day|end of week)',
-            # Explicit task markers
-            r'(?:TODO|Action item|Task|Need to|Have to)[:.]?\s+(\S.{5,})',
-        ]
-
         items = []
         lines = context.split('\n')
 
@@ -334,23 +342,18 @@ class SlackIngester:
 
             # Skip generic phrases
             clean_line = line.lstrip('- @').strip()
-            skip = False
-            for skip_pat in skip_patterns:
-                if re.match(skip_pat, clean_line, re.IGNORECASE):
-                    skip = True
-                    break
-            if skip:
+            if _SKIP_RE.match(clean_line):
                 continue
 
             # Check for action patterns
-            for pattern in action_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
+            for pattern in _ACTION_PATTERNS:
+                match = pattern.search(line)
                 if match:
                     # Get the matched action or full line
                     item = match.group(1) if match.groups() else line
                     item = item.strip()
                     # Clean up
-                    item = re.sub(r'^[?\-\s]+', '', item)
+                    item = _LEADING_JUNK_RE.sub('', item)
                     item = item.strip('?.,!').strip()
 
                     if item and len(item) > 10 and item not in items:
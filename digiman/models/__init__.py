@@ -1,5 +1,5 @@
 """Database models for Digiman."""
 
-from .todo import Todo, SyncHistory, ProcessedSource, get_db, init_db
+from .todo import Todo, TodoView, SyncHistory, ProcessedSource, get_db, init_db
 
-__all__ = ["Todo", "SyncHistory", "ProcessedSource", "get_db", "init_db"]
+__all__ = ["Todo", "TodoView", "SyncHistory", "ProcessedSource", "get_db", "init_db"]
@@ -4,7 +4,7 @@ import sqlite3
 import json
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NamedTuple, Set, Tuple, Iterable
 from contextlib import contextmanager
 
 from digiman.config import DATABASE_PATH
@@ -28,10 +28,33 @@ def get_db():
         conn.close()
 
 
+@contextmanager
+def get_db_tuple():
+    """Context manager for connections returning plain tuples.
+
+    For read paths that select an explicit column list and unpack by position.
+    """
+    conn = sqlite3.connect(get_db_path())
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
 def init_db():
-    """Initialize the database schema."""
+    """Initialize the database schema.
+
+    An up-to-date database (PRAGMA user_version current) returns after one
+    read, without taking the write lock. Otherwise schema, migrations and
+    ANALYZE share one transaction, so a cold start costs a single commit.
+    """
     with get_db() as conn:
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+
         conn.executescript("""
+            BEGIN IMMEDIATE;
+
             -- Core todo items
             CREATE TABLE IF NOT EXISTS todos (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -50,8 +73,6 @@ def init_db():
 
                 -- Status
                 status TEXT NOT NULL DEFAULT 'pending',  -- 'pending' | 'completed' | 'deferred'
-                is_overdue BOOLEAN DEFAULT FALSE,
-                days_overdue INTEGER DEFAULT 0,
 
                 -- Suggestion flag (items from sync that need user approval)
                 is_suggestion BOOLEAN DEFAULT FALSE,
@@ -91,14 +112,29 @@ def init_db():
             CREATE INDEX IF NOT EXISTS idx_todos_timeline_type ON todos(timeline_type);
             CREATE INDEX IF NOT EXISTS idx_processed_sources_lookup ON processed_sources(source_type, source_id);
         """)
-        conn.commit()
 
         # Run migrations for existing databases
         _run_migrations(conn)
 
+        # Only reached when the schema was just created or migrated
+        conn.execute("ANALYZE")
+        conn.commit()
+
+
+# Bump when adding a migration to _run_migrations
+SCHEMA_VERSION = 1
+
 
 def _run_migrations(conn):
-    """Run schema migrations for existing databases."""
+    """Run schema migrations for existing databases.
+
+    The applied version is stored in PRAGMA user_version, so an up-to-date
+    database skips the table_info probe entirely. Runs inside the caller's
+    transaction; the caller commits.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+
     cursor = conn.cursor()
     cursor.execute("PRAGMA table_info(todos)")
     columns = [col[1] for col in cursor.fetchall()]
@@ -106,13 +142,120 @@ def _run_migrations(conn):
     # Migration: Add is_suggestion column if it doesn't exist
     if "is_suggestion" not in columns:
         cursor.execute("ALTER TABLE todos ADD COLUMN is_suggestion BOOLEAN DEFAULT FALSE")
-        conn.commit()
 
     # Migration: Add tags column if it doesn't exist
     if "tags" not in columns:
         cursor.execute("ALTER TABLE todos ADD COLUMN tags TEXT DEFAULT '[]'")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_todos_tags ON todos(tags)")
-        conn.commit()
+
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+# INSERT ... RETURNING needs SQLite 3.35+
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_SQL_INSERT_TODO = """
+    INSERT INTO todos (
+        title, description, source_type, source_id, source_context,
+        source_url, timeline_type, due_date, due_week, due_month,
+        status, is_suggestion, tags, extraction_confidence
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+class TodoView(NamedTuple):
+    """Read-only snapshot of a todo row for list and render paths."""
+
+    id: int
+    title: str
+    description: Optional[str]
+    source_type: str
+    source_id: Optional[str]
+    source_context: Optional[str]
+    source_url: Optional[str]
+    timeline_type: str
+    due_date: Optional[str]
+    due_week: Optional[str]
+    due_month: Optional[str]
+    status: str
+    is_overdue: bool
+    days_overdue: int
+    is_suggestion: bool
+    tags: List[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    completed_at: Optional[str]
+    extraction_confidence: Optional[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return self._asdict()
+
+
+# Overdue state is derived from due_date at read time rather than stored.
+_SQL_IS_OVERDUE = (
+    "(timeline_type = 'date' AND status = 'pending' AND due_date < date('now', 'localtime'))"
+)
+_SQL_DAYS_OVERDUE = (
+    f"CASE WHEN {_SQL_IS_OVERDUE} "
+    "THEN CAST(julianday(date('now', 'localtime')) - julianday(due_date) AS INTEGER) ELSE 0 END"
+)
+
+# Column list matching TodoView field order, for positional unpacking
+_TODO_VIEW_COLUMNS = ", ".join(
+    {
+        "is_overdue": f"{_SQL_IS_OVERDUE} AS is_overdue",
+        "days_overdue": f"{_SQL_DAYS_OVERDUE} AS days_overdue",
+    }.get(field, field)
+    for field in TodoView._fields
+)
+
+# Today view sections (overdue, today, this week, completed today) fetched in
+# a single statement, tagged by category.
+_SQL_TODAY_SECTIONS = f"""
+    SELECT * FROM (
+        SELECT 'overdue' AS category, due_date AS sort_key, {_TODO_VIEW_COLUMNS} FROM todos
+        WHERE timeline_type = 'date' AND due_date < :today AND status = 'pending'
+        AND (is_suggestion = 0 OR is_suggestion IS NULL)
+
+        UNION ALL
+
+        SELECT 'today', created_at, {_TODO_VIEW_COLUMNS} FROM todos
+        WHERE timeline_type = 'date' AND due_date = :today AND status = 'pending'
+        AND (is_suggestion = 0 OR is_suggestion IS NULL)
+
+        UNION ALL
+
+        SELECT 'this_week', created_at, {_TODO_VIEW_COLUMNS} FROM todos
+        WHERE timeline_type = 'week' AND due_week = :week AND status = 'pending'
+        AND (is_suggestion = 0 OR is_suggestion IS NULL)
+
+        UNION ALL
+
+        SELECT 'completed', completed_at, {_TODO_VIEW_COLUMNS} FROM todos
+        WHERE status = 'completed' AND DATE(completed_at) = :today
+    )
+    ORDER BY CASE WHEN category = 'overdue' THEN sort_key END ASC, sort_key DESC
+"""
+
+
+def _today_context() -> Tuple[str, str, str, str]:
+    """Return (today, tomorrow, ISO week, month) strings from a single clock read."""
+    today = date.today()
+    iso_year, iso_week, _ = today.isocalendar()
+    return (
+        today.isoformat(),
+        (today + timedelta(days=1)).isoformat(),
+        f"{iso_year}-W{iso_week:02d}",
+        today.strftime("%Y-%m"),
+    )
+
+
+def _parse_tags(tags_raw: Optional[str]) -> List[str]:
+    """Parse the JSON-encoded tags column."""
+    try:
+        return json.loads(tags_raw) if tags_raw else []
+    except (json.JSONDecodeError, TypeError):
+        return []
 
 
 class Todo:
@@ -134,8 +277,6 @@ class Todo:
             self.due_week = kwargs.get("due_week")
             self.due_month = kwargs.get("due_month")
             self.status = kwargs.get("status", "pending")
-            self.is_overdue = kwargs.get("is_overdue", False)
-            self.days_overdue = kwargs.get("days_overdue", 0)
             self.is_suggestion = kwargs.get("is_suggestion", False)
             self.tags = kwargs.get("tags", [])
             self.created_at = kwargs.get("created_at")
@@ -157,20 +298,49 @@ class Todo:
         self.due_week = row["due_week"]
         self.due_month = row["due_month"]
         self.status = row["status"]
-        self.is_overdue = bool(row["is_overdue"])
-        self.days_overdue = row["days_overdue"]
         self.is_suggestion = bool(row["is_suggestion"]) if "is_suggestion" in row.keys() else False
         # Parse tags from JSON string
-        tags_raw = row["tags"] if "tags" in row.keys() else "[]"
-        try:
-            self.tags = json.loads(tags_raw) if tags_raw else []
-        except (json.JSONDecodeError, TypeError):
-            self.tags = []
+        self.tags = _parse_tags(row["tags"] if "tags" in row.keys() else "[]")
         self.created_at = row["created_at"]
         self.updated_at = row["updated_at"]
         self.completed_at = row["completed_at"]
         self.extraction_confidence = row["extraction_confidence"]
 
+    @property
+    def days_overdue(self) -> int:
+        """Days past due_date for a pending dated todo, else 0."""
+        if self.status != "pending" or self.timeline_type != "date" or not self.due_date:
+            return 0
+        due = date.fromisoformat(self.due_date) if isinstance(self.due_date, str) else self.due_date
+        return max((date.today() - due).days, 0)
+
+    @property
+    def is_overdue(self) -> bool:
+        """Whether the todo is past its due date."""
+        return self.days_overdue > 0
+
+    @classmethod
+    def view_from_row(cls, row: sqlite3.Row) -> TodoView:
+        """Build a read-only TodoView from a database row."""
+        keys = row.keys()
+        return TodoView(
+            row["id"], row["title"], row["description"], row["source_type"],
+            row["source_id"], row["source_context"], row["source_url"],
+            row["timeline_type"], row["due_date"], row["due_week"], row["due_month"],
+            row["status"], bool(row["is_overdue"]), row["days_overdue"],
+            bool(row["is_suggestion"]) if "is_suggestion" in keys else False,
+            _parse_tags(row["tags"] if "tags" in keys else "[]"),
+            row["created_at"], row["updated_at"], row["completed_at"],
+            row["extraction_confidence"],
+        )
+
+    @classmethod
+    def view_from_tuple(cls, row: tuple) -> TodoView:
+        """Build a TodoView from a plain tuple selected with _TODO_VIEW_COLUMNS."""
+        return TodoView._make(
+            row[:12] + (bool(row[12]), row[13], bool(row[14]), _parse_tags(row[15])) + row[16:]
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -208,60 +378,59 @@ class Todo:
                         title = ?, description = ?, source_type = ?, source_id = ?,
                         source_context = ?, source_url = ?, timeline_type = ?,
                         due_date = ?, due_week = ?, due_month = ?, status = ?,
-                        is_overdue = ?, days_overdue = ?, is_suggestion = ?, tags = ?,
-                        updated_at = ?, completed_at = ?, extraction_confidence = ?
+                        is_suggestion = ?, tags = ?,
+                        updated_at = CURRENT_TIMESTAMP, completed_at = ?, extraction_confidence = ?
                     WHERE id = ?
                 """, (
                     self.title, self.description, self.source_type, self.source_id,
                     self.source_context, self.source_url, self.timeline_type,
                     self.due_date, self.due_week, self.due_month, self.status,
-                    self.is_overdue, self.days_overdue, self.is_suggestion, tags_json,
-                    datetime.now().isoformat(), self.completed_at, self.extraction_confidence, self.id
+                    self.is_suggestion, tags_json,
+                    self.completed_at, self.extraction_confidence, self.id
                 ))
             else:
-                cursor = conn.execute("""
-                    INSERT INTO todos (
-                        title, description, source_type, source_id, source_context,
-                        source_url, timeline_type, due_date, due_week, due_month,
-                        status, is_overdue, days_overdue, is_suggestion, tags, extraction_confidence
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    self.title, self.description, self.source_type, self.source_id,
-                    self.source_context, self.source_url, self.timeline_type,
-                    self.due_date, self.due_week, self.due_month, self.status,
-                    self.is_overdue, self.days_overdue, self.is_suggestion, tags_json, self.extraction_confidence
-                ))
-                self.id = cursor.lastrowid
+                self._insert(conn)
             conn.commit()
         return self.id
 
+    def _insert(self, conn: sqlite3.Connection):
+        """INSERT this new todo on conn (caller commits) and set its ID."""
+        params = (
+            self.title, self.description, self.source_type, self.source_id,
+            self.source_context, self.source_url, self.timeline_type,
+            self.due_date, self.due_week, self.due_month, self.status,
+            self.is_suggestion, json.dumps(self.tags) if self.tags else "[]",
+            self.extraction_confidence
+        )
+        if _SUPPORTS_RETURNING:
+            self.id = conn.execute(_SQL_INSERT_TODO + " RETURNING id", params).fetchone()[0]
+        else:
+            self.id = conn.execute(_SQL_INSERT_TODO, params).lastrowid
+
+    @classmethod
+    def bulk_save(cls, todos: Iterable["Todo"]) -> List[int]:
+        """Insert many new todos in one transaction. Returns their IDs."""
+        todos = list(todos)
+        if not todos:
+            return []
+        with get_db() as conn:
+            for todo in todos:
+                todo._insert(conn)
+            conn.commit()
+        return [todo.id for todo in todos]
+
     def complete(self):
         """Mark todo as completed."""
         self.status = "completed"
         self.completed_at = datetime.now().isoformat()
-        self.is_overdue = False
-        self.days_overdue = 0
         self.save()
 
     def uncomplete(self):
         """Mark todo as pending."""
         self.status = "pending"
         self.completed_at = None
-        self._update_overdue_status()
         self.save()
 
-    def _update_overdue_status(self):
-        """Update is_overdue and days_overdue based on due_date."""
-        if self.timeline_type == "date" and self.due_date:
-            due = date.fromisoformat(self.due_date) if isinstance(self.due_date, str) else self.due_date
-            today = date.today()
-            if due < today:
-                self.is_overdue = True
-                self.days_overdue = (today - due).days
-            else:
-                self.is_overdue = False
-                self.days_overdue = 0
-
     def reassign(self, timeline_type: str, value: Optional[str] = None):
         """Reassign todo to a different timeline."""
         self.timeline_type = timeline_type
@@ -276,135 +445,91 @@ class Todo:
         elif timeline_type == "month" and value:
             self.due_month = value
 
-        self._update_overdue_status()
         self.save()
 
     @classmethod
     def get_by_id(cls, todo_id: int) -> Optional["Todo"]:
         """Get todo by ID."""
         with get_db() as conn:
-            row = conn.execute("SELECT * FROM todos WHERE id = ?", (todo_id,)).fetchone()
+            row = conn.execute(f"SELECT {_TODO_VIEW_COLUMNS} FROM todos WHERE id = ?", (todo_id,)).fetchone()
             return cls(row=row) if row else None
 
     @classmethod
-    def get_all(cls, status: Optional[str] = None) -> List["Todo"]:
-        """Get all todos, optionally filtered by status."""
-        with get_db() as conn:
-            if status:
-                rows = conn.execute(
-                    "SELECT * FROM todos WHERE status = ? ORDER BY due_date ASC, created_at DESC",
-                    (status,)
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT * FROM todos ORDER BY due_date ASC, created_at DESC"
-                ).fetchall()
-            return [cls(row=row) for row in rows]
+    def get_all(cls, status: Optional[str] = None, due_date: Optional[str] = None) -> List[TodoView]:
+        """Get all todos, optionally filtered by status and/or due date."""
+        conditions, params = [], []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if due_date:
+            conditions.append("due_date = ?")
+            params.append(due_date)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with get_db_tuple() as conn:
+            rows = conn.execute(
+                f"SELECT {_TODO_VIEW_COLUMNS} FROM todos {where} ORDER BY due_date ASC, created_at DESC",
+                params
+            ).fetchall()
+            return [cls.view_from_tuple(row) for row in rows]
 
     @classmethod
-    def get_today(cls, tag_filter: Optional[str] = None) -> Dict[str, List["Todo"]]:
+    def get_today(cls, tag_filter: Optional[str] = None) -> Dict[str, List[TodoView]]:
         """Get todos for today view, grouped by category.
 
         Args:
             tag_filter: Optional tag name to filter by
         """
-        today = date.today().isoformat()
-        current_week = date.today().isocalendar()
-        week_str = f"{current_week[0]}-W{current_week[1]:02d}"
+        today, _, week_str, _ = _today_context()
 
-        def filter_by_tag(todos: List["Todo"]) -> List["Todo"]:
+        def filter_by_tag(todos: List[TodoView]) -> List[TodoView]:
             """Filter todos by tag if tag_filter is set."""
             if not tag_filter:
                 return todos
             return [t for t in todos if tag_filter in t.tags]
 
+        buckets = {"overdue": [], "today": [], "this_week": [], "completed": []}
         with get_db() as conn:
-            # Update overdue status for all pending todos
-            conn.execute("""
-                UPDATE todos SET
-                    is_overdue = CASE
-                        WHEN timeline_type = 'date' AND due_date < ? AND status = 'pending' THEN 1
-                        ELSE 0
-                    END,
-                    days_overdue = CASE
-                        WHEN timeline_type = 'date' AND due_date < ? AND status = 'pending'
-                        THEN julianday(?) - julianday(due_date)
-                        ELSE 0
-                    END
-                WHERE status = 'pending'
-            """, (today, today, today))
-            conn.commit()
-
-            # Get overdue (exclude suggestions)
-            overdue_rows = conn.execute("""
-                SELECT * FROM todos
-                WHERE is_overdue = 1 AND status = 'pending'
-                AND (is_suggestion = 0 OR is_suggestion IS NULL)
-                ORDER BY due_date ASC
-            """).fetchall()
-
-            # Get today's todos (exclude suggestions)
-            today_rows = conn.execute("""
-                SELECT * FROM todos
-                WHERE timeline_type = 'date' AND due_date = ? AND status = 'pending'
-                AND (is_suggestion = 0 OR is_suggestion IS NULL)
-                ORDER BY created_at DESC
-            """, (today,)).fetchall()
-
-            # Get this week's todos (exclude suggestions)
-            week_rows = conn.execute("""
-                SELECT * FROM todos
-                WHERE timeline_type = 'week' AND due_week = ? AND status = 'pending'
-                AND (is_suggestion = 0 OR is_suggestion IS NULL)
-                ORDER BY created_at DESC
-            """, (week_str,)).fetchall()
+            # One statement for all four sections
+            rows = conn.execute(_SQL_TODAY_SECTIONS, {"today": today, "week": week_str}).fetchall()
 
-            # Get completed today
-            completed_rows = conn.execute("""
-                SELECT * FROM todos
-                WHERE status = 'completed' AND DATE(completed_at) = ?
-                ORDER BY completed_at DESC
-            """, (today,)).fetchall()
+        for row in rows:
+            buckets[row["category"]].append(cls.view_from_row(row))
 
-        return {
-            "overdue": filter_by_tag([cls(row=row) for row in overdue_rows]),
-            "today": filter_by_tag([cls(row=row) for row in today_rows]),
-            "this_week": filter_by_tag([cls(row=row) for row in week_rows]),
-            "completed": filter_by_tag([cls(row=row) for row in completed_rows]),
-        }
+        return {category: filter_by_tag(todos) for category, todos in buckets.items()}
 
     @classmethod
     def get_calendar_data(cls, year: int, month: int) -> Dict[str, Any]:
         """Get todos grouped by date for calendar view."""
         month_str = f"{year}-{month:02d}"
 
-        with get_db() as conn:
+        with get_db_tuple() as conn:
             # Get todos with specific dates in this month
-            date_rows = conn.execute("""
-                SELECT * FROM todos
+            date_rows = conn.execute(f"""
+                SELECT {_TODO_VIEW_COLUMNS} FROM todos
                 WHERE timeline_type = 'date'
                 AND strftime('%Y-%m', due_date) = ?
                 ORDER BY due_date ASC, created_at DESC
             """, (month_str,)).fetchall()
 
             # Get weekly todos for weeks in this month
-            week_rows = conn.execute("""
-                SELECT * FROM todos
+            week_rows = conn.execute(f"""
+                SELECT {_TODO_VIEW_COLUMNS} FROM todos
                 WHERE timeline_type = 'week'
                 AND due_week LIKE ?
                 ORDER BY due_week ASC, created_at DESC
             """, (f"{year}-W%",)).fetchall()
 
             # Get monthly todos
-            month_rows = conn.execute("""
-                SELECT * FROM todos
+            month_rows = conn.execute(f"""
+                SELECT {_TODO_VIEW_COLUMNS} FROM todos
                 WHERE timeline_type = 'month' AND due_month = ?
                 ORDER BY created_at DESC
             """, (month_str,)).fetchall()
 
             # Get backlog
-            backlog_rows = conn.execute("""
-                SELECT * FROM todos
+            backlog_rows = conn.execute(f"""
+                SELECT {_TODO_VIEW_COLUMNS} FROM todos
                 WHERE timeline_type = 'backlog' AND status = 'pending'
                 ORDER BY created_at DESC
             """).fetchall()
@@ -412,16 +537,16 @@ class Todo:
         # Group by date
         by_date = {}
         for row in date_rows:
-            todo = cls(row=row)
+            todo = cls.view_from_tuple(row)
             if todo.due_date not in by_date:
                 by_date[todo.due_date] = []
             by_date[todo.due_date].append(todo)
 
         return {
             "by_date": by_date,
-            "weekly": [cls(row=row) for row in week_rows],
-            "monthly": [cls(row=row) for row in month_rows],
-            "backlog": [cls(row=row) for row in backlog_rows],
+            "weekly": [cls.view_from_tuple(row) for row in week_rows],
+            "monthly": [cls.view_from_tuple(row) for row in month_rows],
+            "backlog": [cls.view_from_tuple(row) for row in backlog_rows],
         }
 
     @classmethod
@@ -433,15 +558,15 @@ class Todo:
             return cursor.rowcount > 0
 
     @classmethod
-    def get_suggestions(cls) -> List["Todo"]:
+    def get_suggestions(cls) -> List[TodoView]:
         """Get all pending suggestions (not yet accepted as todos)."""
         with get_db() as conn:
-            rows = conn.execute("""
-                SELECT * FROM todos
+            rows = conn.execute(f"""
+                SELECT {_TODO_VIEW_COLUMNS} FROM todos
                 WHERE is_suggestion = 1 AND status = 'pending'
                 ORDER BY created_at DESC
             """).fetchall()
-            return [cls(row=row) for row in rows]
+            return [cls.view_from_row(row) for row in rows]
 
     @classmethod
     def get_all_tags(cls) -> Dict[str, int]:
@@ -481,7 +606,6 @@ class Todo:
         elif timeline_type == "week" and value:
             self.due_week = value
 
-        self._update_overdue_status()
         self.save()
 
     def discard_suggestion(self):
@@ -505,8 +629,8 @@ class Todo:
         with get_db() as conn:
             # Search with priority: title matches first, then description matches
             # Exclude suggestions and completed items
-            rows = conn.execute("""
-                SELECT *,
+            rows = conn.execute(f"""
+                SELECT {_TODO_VIEW_COLUMNS},
                     CASE
                         WHEN LOWER(title) LIKE LOWER(?) THEN 1
                         ELSE 2
@@ -530,7 +654,7 @@ class Todo:
         Returns:
             List of pending todos due tomorrow
         """
-        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        _, tomorrow, _, _ = _today_context()
 
         def filter_by_tag(todos: List["Todo"]) -> List["Todo"]:
             if not tag_filter:
@@ -538,8 +662,8 @@ class Todo:
             return [t for t in todos if tag_filter in t.tags]
 
         with get_db() as conn:
-            rows = conn.execute("""
-                SELECT * FROM todos
+            rows = conn.execute(f"""
+                SELECT {_TODO_VIEW_COLUMNS} FROM todos
                 WHERE timeline_type = 'date' AND due_date = ? AND status = 'pending'
                 AND (is_suggestion = 0 OR is_suggestion IS NULL)
                 ORDER BY created_at DESC
@@ -562,8 +686,8 @@ class Todo:
             return [t for t in todos if tag_filter in t.tags]
 
         with get_db() as conn:
-            rows = conn.execute("""
-                SELECT * FROM todos
+            rows = conn.execute(f"""
+                SELECT {_TODO_VIEW_COLUMNS} FROM todos
                 WHERE timeline_type = 'backlog' AND status = 'pending'
                 AND (is_suggestion = 0 OR is_suggestion IS NULL)
                 ORDER BY created_at DESC
@@ -580,8 +704,8 @@ class SyncHistory:
         with get_db() as conn:
             cursor = conn.execute("""
                 INSERT INTO sync_history (sync_type, started_at)
-                VALUES (?, ?)
-            """, (sync_type, datetime.now().isoformat()))
+                VALUES (?, CURRENT_TIMESTAMP)
+            """, (sync_type,))
             conn.commit()
             return cursor.lastrowid
 
@@ -591,12 +715,12 @@ class SyncHistory:
         with get_db() as conn:
             conn.execute("""
                 UPDATE sync_history SET
-                    completed_at = ?,
+                    completed_at = CURRENT_TIMESTAMP,
                     items_processed = ?,
                     items_extracted = ?,
                     errors = ?
                 WHERE id = ?
-            """, (datetime.now().isoformat(), items_processed, items_extracted, errors, sync_id))
+            """, (items_processed, items_extracted, errors, sync_id))
             conn.commit()
 
 
@@ -613,6 +737,26 @@ class ProcessedSource:
             """, (source_type, source_id)).fetchone()
             return row is not None
 
+    @classmethod
+    def load_all(cls) -> Set[Tuple[str, str]]:
+        """Load every processed (source_type, source_id) pair.
+
+        Lets sync loops check membership in memory instead of querying per item.
+        """
+        with get_db() as conn:
+            rows = conn.execute("SELECT source_type, source_id FROM processed_sources").fetchall()
+            return {(row[0], row[1]) for row in rows}
+
+    @classmethod
+    def bulk_mark(cls, pairs: Iterable[Tuple[str, str]]):
+        """Mark many (source_type, source_id) pairs as processed in one transaction."""
+        with get_db() as conn:
+            conn.executemany("""
+                INSERT OR IGNORE INTO processed_sources (source_type, source_id)
+                VALUES (?, ?)
+            """, pairs)
+            conn.commit()
+
     @classmethod
     def mark_processed(cls, source_type: str, source_id: str):
         """Mark a source as processed."""
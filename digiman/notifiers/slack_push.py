@@ -1,113 +1,116 @@
 """Slack morning briefing push notification."""
 
+import threading
+from collections import defaultdict
 from datetime import date
 from typing import Optional
 
 from digiman.config import SLACK_BOT_TOKEN, SLACK_USER_ID
+from digiman.models import Todo
 
-# Post briefings to #mydailyplanner (private channel)
+# Post briefings to #mydailyplanner (private channel) unless told otherwise
 BRIEFING_CHANNEL = "C093CG2KA1G"
-from digiman.models import Todo
 
+# Briefing sections; each ends with a blank line when joined
+_SECTION_HEADER = "🧠 *Digiman Daily Briefing - {day}*\n"
+_SECTION_SUGGESTIONS = "💡 *NEW SUGGESTIONS* ({count} items to review)\n"
+_SECTION_MEETINGS = "*From Meetings:*\n{body}\n"
+_SECTION_SLACK = "*From Slack Mentions:*\n{body}\n"
+_SECTION_OVERDUE = "🔴 *OVERDUE* ({count} items)\n{body}\n"
+_SECTION_TODAY = "📅 *TODAY* ({count} items)\n{body}\n"
+_SECTION_WEEK = "📆 *THIS WEEK* ({count} items)\n{body}\n"
+_SECTION_EMPTY = "✨ All clear! No pending tasks.\n"
+_SECTION_FOOTER = (
+    "─────────────────────────\n"
+    "🔗 <https://manmohanbuildsproducts.pythonanywhere.com|Open Digiman>"
+)
 
-class SlackPusher:
-    """Send morning briefing to Slack DM."""
 
-    def __init__(self, bot_token: Optional[str] = None, user_id: Optional[str] = None):
+class SlackPusher:
+    """Send morning briefing to a Slack channel (#mydailyplanner by default)."""
+
+    # WebClient shared by every pusher using the same token
+    _shared_client = None
+    _shared_token = None
+    _client_lock = threading.Lock()
+
+    def __init__(
+        self,
+        bot_token: Optional[str] = None,
+        user_id: Optional[str] = None,
+        channel: Optional[str] = None,
+    ):
         self.bot_token = bot_token or SLACK_BOT_TOKEN
         self.user_id = user_id or SLACK_USER_ID
-        self._client = None
+        self.channel = channel or BRIEFING_CHANNEL
 
     @property
     def client(self):
-        """Lazy-load Slack client."""
-        if self._client is None:
-            if not self.bot_token:
-                raise ValueError("SLACK_BOT_TOKEN not configured")
-            from slack_sdk import WebClient
-            self._client = WebClient(token=self.bot_token)
-        return self._client
+        """Lazy-load Slack client, shared across SlackPusher instances."""
+        if not self.bot_token:
+            raise ValueError("SLACK_BOT_TOKEN not configured")
+        cls = type(self)
+        with cls._client_lock:
+            if cls._shared_client is None or cls._shared_token != self.bot_token:
+                from slack_sdk import WebClient
+                cls._shared_client = WebClient(token=self.bot_token, timeout=10)
+                cls._shared_token = self.bot_token
+            return cls._shared_client
 
     def format_briefing(self, todos: dict, suggestions: list = None) -> str:
         """Format the morning briefing message."""
-        today = date.today()
-        lines = [
-            f"🧠 *Digiman Daily Briefing - {today.strftime('%A, %b %d, %Y')}*",
-            ""
-        ]
+        header = _SECTION_HEADER.format(day=date.today().strftime('%A, %b %d, %Y'))
 
         # New Suggestions (from overnight sync) - grouped by source
+        sugg_block = ""
         if suggestions:
-            # Separate by source
-            granola_suggestions = [s for s in suggestions if s.source_type == 'granola']
-            slack_suggestions = [s for s in suggestions if s.source_type == 'slack']
-
-            lines.append(f"💡 *NEW SUGGESTIONS* ({len(suggestions)} items to review)")
-            lines.append("")
-
-            # Granola suggestions - grouped by meeting
-            if granola_suggestions:
-                lines.append("*From Meetings:*")
-                # Group by meeting (source_context)
-                meetings = {}
-                for sugg in granola_suggestions:
-                    meeting = sugg.source_context or "Unknown Meeting"
-                    if meeting not in meetings:
-                        meetings[meeting] = []
-                    meetings[meeting].append(sugg)
-
-                for meeting_title, items in meetings.items():
-                    lines.append(f"📝 _{meeting_title}_")
-                    for sugg in items:
-                        lines.append(f"    • {sugg.title}")
-                lines.append("")
-
-            # Slack suggestions
-            if slack_suggestions:
-                lines.append("*From Slack Mentions:*")
-                for sugg in slack_suggestions:
-                    channel = sugg.source_context or "#unknown"
-                    lines.append(f"💬 {channel}: {sugg.title}")
-                lines.append("")
-
-        # Overdue - show all
-        if todos.get("overdue"):
-            lines.append(f"🔴 *OVERDUE* ({len(todos['overdue'])} items)")
-            for todo in todos["overdue"]:
-                days = f"({todo.days_overdue}d)" if todo.days_overdue else ""
-                context = f" _{todo.source_context}_" if todo.source_context else ""
-                lines.append(f"• {todo.title} {days}{context}")
-            lines.append("")
-
-        # Today - show all
-        if todos.get("today"):
-            lines.append(f"📅 *TODAY* ({len(todos['today'])} items)")
-            for todo in todos["today"]:
-                context = f" - _{todo.source_context}_" if todo.source_context else ""
-                lines.append(f"• {todo.title}{context}")
-            lines.append("")
-
-        # This Week - show all
-        if todos.get("this_week"):
-            lines.append(f"📆 *THIS WEEK* ({len(todos['this_week'])} items)")
-            for todo in todos["this_week"]:
-                context = f" - _{todo.source_context}_" if todo.source_context else ""
-                lines.append(f"• {todo.title}{context}")
-            lines.append("")
+            # Granola suggestions - grouped by meeting (source_context)
+            meetings = defaultdict(list)
+            for sugg in suggestions:
+                if sugg.source_type == 'granola':
+                    meetings[sugg.source_context or "Unknown Meeting"].append(sugg)
+            granola_block = meetings and _SECTION_MEETINGS.format(body="\n".join(
+                f"📝 _{meeting_title}_\n" + "\n".join(f"    • {sugg.title}" for sugg in items)
+                for meeting_title, items in meetings.items()
+            ))
+
+            slack_block = "\n".join(
+                f"💬 {sugg.source_context or '#unknown'}: {sugg.title}"
+                for sugg in suggestions if sugg.source_type == 'slack'
+            )
+            slack_block = slack_block and _SECTION_SLACK.format(body=slack_block)
+
+            sugg_block = "\n".join(filter(None, [
+                _SECTION_SUGGESTIONS.format(count=len(suggestions)), granola_block, slack_block
+            ]))
+
+        # Overdue, today and this week - show all
+        overdue = todos.get("overdue")
+        overdue_block = overdue and _SECTION_OVERDUE.format(count=len(overdue), body="\n".join(
+            f"• {todo.title} {f'({todo.days_overdue}d)' if todo.days_overdue else ''}"
+            f"{f' _{todo.source_context}_' if todo.source_context else ''}"
+            for todo in overdue
+        ))
+        today_items = todos.get("today")
+        today_block = today_items and _SECTION_TODAY.format(count=len(today_items), body="\n".join(
+            f"• {todo.title}{f' - _{todo.source_context}_' if todo.source_context else ''}"
+            for todo in today_items
+        ))
+        week = todos.get("this_week")
+        week_block = week and _SECTION_WEEK.format(count=len(week), body="\n".join(
+            f"• {todo.title}{f' - _{todo.source_context}_' if todo.source_context else ''}"
+            for todo in week
+        ))
 
         # No items at all
-        if not suggestions and not todos.get("overdue") and not todos.get("today") and not todos.get("this_week"):
-            lines.append("✨ All clear! No pending tasks.")
-            lines.append("")
-
-        # Footer
-        lines.append("─────────────────────────")
-        lines.append("🔗 <https://manmohanbuildsproducts.pythonanywhere.com|Open Digiman>")
+        empty_block = "" if (sugg_block or overdue_block or today_block or week_block) else _SECTION_EMPTY
 
-        return "\n".join(lines)
+        return "\n".join(filter(None, [
+            header, sugg_block, overdue_block, today_block, week_block, empty_block, _SECTION_FOOTER
+        ]))
 
     def send_briefing(self) -> bool:
-        """Send the morning briefing to user's DM.
+        """Send the morning briefing to the configured channel.
 
         Returns True on success, False on failure.
         """
@@ -125,14 +128,13 @@ class SlackPusher:
             # Format message
             message = self.format_briefing(todos, suggestions)
 
-            # Send to #mydailyplanner channel
             self.client.chat_postMessage(
-                channel=BRIEFING_CHANNEL,
+                channel=self.channel,
                 text=message,
                 mrkdwn=True
             )
 
-            print("✅ Morning briefing sent to #mydailyplanner")
+            print(f"✅ Morning briefing sent to {self.channel}")
             return True
 
         except Exception as e:
@@ -1,93 +1,269 @@
 #!/usr/bin/env python3
 """Digiman Menu Bar App for macOS - Todo management only."""
 
+import json
+import httpx
 import rumps
-import requests
+import sys
 import webbrowser
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import partial
+from Foundation import NSObject
+from PyObjCTools import AppHelper
+
+try:
+    import orjson  # optional, faster JSON
+except ImportError:
+    orjson = None
 
 # Configuration
 API_BASE = "https://www.whileyousleep.xyz"
+JSON_HEADERS = {"Content-Type": "application/json"}
+FLUSH_DELAY = 0.3  # seconds to wait for more clicks before sending
+POLL_INTERVAL = 60  # seconds between conditional refreshes of the todo list
+
+
+if sys.platform == "darwin":
+    from AppKit import NSWorkspace
+    from Foundation import NSURL
+
+    _WORKSPACE = NSWorkspace.sharedWorkspace()
+
+    def open_url(url):
+        """Open url in the default browser without spawning /usr/bin/open."""
+        _WORKSPACE.openURL_(NSURL.URLWithString_(url))
+else:
+    open_url = webbrowser.open
+
+
+def loads(data):
+    """Decode JSON bytes/str, using orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def dumps(obj):
+    """Encode a JSON request body, using orjson when available."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+
+def make_client():
+    """Create an HTTP/2 client so concurrent menu actions share one connection."""
+    # Only connect failures are retried: nothing reached the server, and
+    # /toggle isn't idempotent.
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+    )
+    return httpx.Client(
+        base_url=API_BASE,
+        transport=transport,
+        timeout=httpx.Timeout(5.0),
+        headers={
+            "User-Agent": "digiman-menubar",
+            "Accept": "application/json",
+        },
+    )
+
+
+class MenuUpdateDelegate(NSObject):
+    """NSMenuDelegate that runs `callback` right before the menu is shown."""
+
+    def menuNeedsUpdate_(self, menu):
+        self.callback()
 
 
 class DigimanMenuBar(rumps.App):
     def __init__(self):
         super().__init__("Digiman", title="🧠 0", quit_button=None)
         self.todos = []
+        # The (at most 10) todos shown as rows, and their (menu label, todo)
+        # pairs, both computed once per refresh
+        self._visible_todos = []
+        self._display = []
+        self.client = make_client()
+        # Network I/O runs here so the menu bar never blocks on the API
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._etag = None
+        # Todo count plus the (label, todo) pairs of the visible rows
+        self._todos_key = None
+        # Complete/move clicks within FLUSH_DELAY share one refresh + notification
+        self._pending_ops = deque()
+        # Todo ids with an action queued or in flight; /toggle isn't
+        # idempotent, so a second click on the same row is dropped
+        self._busy_ids = set()
+        self._flush_scheduled = False
 
-        # Build initial menu structure
+        # Fixed items are built once; rebuild_menu only adds, removes or
+        # retitles todo rows below the header.
+        self._header = rumps.MenuItem("Loading...", callback=None)
+        self._header_key = self._header.title
+        self._item_by_id = {}  # todo id -> (menu key, MenuItem, todo)
         self.menu = [
-            rumps.MenuItem("Loading...", callback=None),
+            self._header,
+            None,  # separator, dropped while there are no todos
+            rumps.MenuItem("➕  New Todo", callback=self.on_add_todo),
+            rumps.MenuItem("🔄  Refresh", callback=self.on_refresh),
+            None,  # separator
+            rumps.MenuItem("🌐  Open Full App", callback=self.on_open_web),
+            rumps.MenuItem("Quit Digiman", callback=self.on_quit),
         ]
+        self._header_sep_key = self._key_after(self._header_key)
+
+        # Rows are only rebuilt when the menu is about to open; background
+        # refreshes just update the count in the title.
+        self._menu_dirty = False
+        self._menu_delegate = MenuUpdateDelegate.alloc().init()
+        self._menu_delegate.callback = self._on_menu_open
+        self.menu._menu.setDelegate_(self._menu_delegate)
 
-        # Initial load
+        # Initial load, then revalidate on a timer (unchanged lists come back as 304)
         self.refresh_todos()
+        self._poll_timer = rumps.Timer(self._poll_todos, POLL_INTERVAL)
+        self._poll_timer.start()
 
-    def refresh_todos(self):
-        """Fetch today's todos from the API."""
+    def run_in_background(self, work, on_done):
+        """Run blocking work on the pool, then on_done(future) on the main thread."""
+        future = self._pool.submit(work)
+        future.add_done_callback(lambda f: AppHelper.callAfter(on_done, f))
+
+    def refresh_todos(self, notify=False):
+        """Fetch today's todos from the API in the background."""
+        today = date.today()
+        self._today_iso = today.isoformat()
+        self._tomorrow_iso = (today + timedelta(days=1)).isoformat()
+        # Every move-to-tomorrow until the next refresh sends the same body
+        self._move_body = dumps({"timeline_type": "date", "value": self._tomorrow_iso})
+        self.run_in_background(self._fetch_todos, partial(self._apply_todos, notify=notify))
+
+    def _fetch_todos(self):
+        """Return today's pending todos, or None if unchanged or the API errored."""
+        headers = {"If-None-Match": self._etag} if self._etag else {}
+        response = self.client.get(
+            "/api/todos",
+            params={"due_date": self._today_iso, "status": "pending"},
+            headers=headers
+        )
+        if response.status_code == 304 or not response.is_success:
+            return None
+        self._etag = response.headers.get("ETag")
+        return loads(response.content)
+
+    def _poll_todos(self, _):
+        """Timer: revalidate today's todos, dropping the ETag once the date rolls over."""
+        if date.today().isoformat() != self._today_iso:
+            self._etag = None
+        self.refresh_todos()
+
+    def _set_todos(self, todos):
+        """Store todos, update the count and mark the menu stale if it changed."""
+        self.todos = todos
+        self._visible_todos = todos[:10]
+        self._display = [
+            (
+                f"☐  {(t['title'][:55] + '...') if len(t['title']) > 55 else t['title']}"
+                f"{' 📝' if t.get('description') else ''}",
+                t
+            )
+            for t in self._visible_todos
+        ]
+        # Update title with count
+        count = len(todos)
+        self.title = "🧠 ✓" if count == 0 else f"🧠 {count}"
+
+        # Rows hold the label and the todo dict (shown in the action alert),
+        # so any change to either marks them stale
+        key = (count, self._display)
+        if key != self._todos_key:
+            self._todos_key = key
+            self._menu_dirty = True
+
+    def _on_menu_open(self):
+        """Rebuild stale rows just before the menu is displayed."""
+        if self._menu_dirty:
+            self._menu_dirty = False
+            self.rebuild_menu()
+
+    def _apply_todos(self, future, notify=False):
+        """Store fetched todos and redraw the menu (main thread)."""
         try:
-            response = requests.get(f"{API_BASE}/api/todos", timeout=5)
-            if response.ok:
-                all_todos = response.json()
-                today = date.today().isoformat()
-                self.todos = [
-                    t for t in all_todos
-                    if t.get("due_date") == today and t.get("status") == "pending"
-                ]
+            todos = future.result()
+            if todos is not None:
+                self._set_todos(todos)
         except Exception as e:
             print(f"Error fetching todos: {e}")
-            self.todos = []
+            # The cleared list no longer matches the ETag; refetch in full next time
+            self._etag = None
+            self._set_todos([])
 
-        self.rebuild_menu()
+        if notify:
+            count = len(self.todos)
+            msg = "All clear!" if count == 0 else f"{count} todo{'s' if count != 1 else ''}"
+            rumps.notification("Digiman", "Refreshed", msg)
+
+    def _after_action(self, future, subtitle, message):
+        """Notify about a finished API action and refresh (main thread)."""
+        try:
+            response = future.result()
+        except Exception as e:
+            rumps.notification("Digiman", "Error", str(e))
+            return
+
+        if response.is_success:
+            rumps.notification("Digiman", subtitle, message)
+            self.refresh_todos()
+
+    def _key_after(self, key):
+        """Return the menu key that follows key."""
+        keys = list(self.menu.keys())
+        return keys[keys.index(key) + 1]
 
     def rebuild_menu(self):
-        """Rebuild the menu with current todos."""
-        self.menu.clear()
+        """Sync the menu with current todos, touching only rows that changed."""
         count = len(self.todos)
 
-        # Update title with count
-        if count == 0:
-            self.title = "🧠 ✓"
-        else:
-            self.title = f"🧠 {count}"
-
         # === HEADER ===
-        if count == 0:
-            self.menu.add(rumps.MenuItem("✓  All done for today!", callback=None))
-        else:
-            self.menu.add(rumps.MenuItem(f"TODAY ({count})", callback=None))
-            self.menu.add(None)  # separator
-
-            # === TODO ITEMS ===
-            for todo in self.todos[:10]:
-                title = todo['title']
-                if len(title) > 55:
-                    title = title[:55] + "..."
-
-                # Add indicator if has description
-                desc = todo.get('description')
-                indicator = " 📝" if desc else ""
-
-                item = rumps.MenuItem(
-                    f"☐  {title}{indicator}",
-                    callback=self.make_todo_callback(todo)
-                )
-                self.menu.add(item)
-
-        # === ACTIONS ===
-        self.menu.add(None)  # separator
-        self.menu.add(rumps.MenuItem("➕  New Todo", callback=self.on_add_todo))
-        self.menu.add(rumps.MenuItem("🔄  Refresh", callback=self.on_refresh))
-
-        # === WEB ===
-        self.menu.add(None)  # separator
-        self.menu.add(rumps.MenuItem("🌐  Open Full App", callback=self.on_open_web))
-
-    def make_todo_callback(self, todo):
-        """Create callback for a todo item."""
-        def callback(sender):
-            self.show_todo_actions(todo)
-        return callback
+        header = "✓  All done for today!" if count == 0 else f"TODAY ({count})"
+        if self._header.title != header:
+            self._header.title = header
+
+        if count == 0 and self._header_sep_key:
+            del self.menu[self._header_sep_key]
+            self._header_sep_key = None
+        elif count and not self._header_sep_key:
+            self.menu.insert_after(self._header_key, None)
+            self._header_sep_key = self._key_after(self._header_key)
+
+        # === TODO ITEMS ===
+        shown = {todo['id'] for _, todo in self._display}
+        for todo_id in set(self._item_by_id) - shown:
+            key, _, _ = self._item_by_id.pop(todo_id)
+            del self.menu[key]
+
+        anchor = self._header_sep_key
+        for label, todo in self._display:
+            todo_id = todo['id']
+            if todo_id in self._item_by_id:
+                key, item, old_todo = self._item_by_id[todo_id]
+                if item.title != label:
+                    item.title = label
+                if old_todo != todo:
+                    item.set_callback(partial(self._on_todo_click, todo))
+                    self._item_by_id[todo_id] = (key, item, todo)
+            else:
+                if label in self.menu:
+                    continue  # same label already shown
+                item = rumps.MenuItem(label, callback=partial(self._on_todo_click, todo))
+                self.menu.insert_after(anchor, item)
+                key = label
+                self._item_by_id[todo_id] = (key, item, todo)
+            anchor = key
+
+    def _on_todo_click(self, todo, sender):
+        """Menu callback for a todo row."""
+        self.show_todo_actions(todo)
 
     def show_todo_actions(self, todo):
         """Show action dialog for a todo."""
@@ -110,35 +286,67 @@ class DigimanMenuBar(rumps.App):
 
     def complete_todo(self, todo_id):
         """Mark todo as complete."""
-        try:
-            response = requests.post(f"{API_BASE}/api/todos/{todo_id}/toggle", timeout=5)
-            if response.ok:
-                rumps.notification("Digiman", "✓ Completed", "Nice work!")
-                self.refresh_todos()
-        except Exception as e:
-            rumps.notification("Digiman", "Error", str(e))
+        self._queue_op("complete", todo_id)
 
     def move_to_tomorrow(self, todo_id):
         """Move todo to tomorrow."""
-        try:
-            tomorrow = (date.today() + timedelta(days=1)).isoformat()
-            response = requests.post(
-                f"{API_BASE}/api/todos/{todo_id}/reassign",
-                json={"timeline_type": "date", "value": tomorrow},
-                timeout=5
-            )
-            if response.ok:
-                rumps.notification("Digiman", "→ Moved", "Rescheduled to tomorrow")
-                self.refresh_todos()
-        except Exception as e:
-            rumps.notification("Digiman", "Error", str(e))
+        self._queue_op("move", todo_id)
+
+    def _queue_op(self, kind, todo_id):
+        """Queue a todo action; a burst of clicks is sent by one _flush."""
+        if todo_id in self._busy_ids:
+            return
+        self._busy_ids.add(todo_id)
+        self._pending_ops.append((kind, todo_id))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            AppHelper.callLater(FLUSH_DELAY, self._flush)
+
+    def _flush(self):
+        """Send all queued actions in the background (main thread)."""
+        self._flush_scheduled = False
+        ops = list(self._pending_ops)
+        self._pending_ops.clear()
+        self.run_in_background(partial(self._send_ops, ops), partial(self._after_flush, ops))
+
+    def _send_ops(self, ops):
+        """POST queued actions; return (counts of successes by kind, last error)."""
+        done, error = Counter(), None
+        for kind, todo_id in ops:
+            try:
+                if kind == "complete":
+                    response = self.client.post(f"/api/todos/{todo_id}/toggle")
+                else:
+                    response = self.client.post(
+                        f"/api/todos/{todo_id}/reassign",
+                        content=self._move_body,
+                        headers=JSON_HEADERS
+                    )
+                if response.is_success:
+                    done[kind] += 1
+            except Exception as e:
+                error = str(e)
+        return done, error
+
+    def _after_flush(self, ops, future):
+        """Refresh once and show one notification for the batch (main thread)."""
+        self._busy_ids.difference_update(todo_id for _, todo_id in ops)
+        done, error = future.result()
+        parts = []
+        if done["complete"]:
+            parts.append(f"✓ {done['complete']} completed")
+        if done["move"]:
+            parts.append(f"→ {done['move']} moved to tomorrow")
+
+        if parts:
+            rumps.notification("Digiman", ", ".join(parts), error or "Nice work!")
+            self.refresh_todos()
+        elif error:
+            rumps.notification("Digiman", "Error", error)
 
     def on_refresh(self, _):
         """Refresh todos."""
-        self.refresh_todos()
-        count = len(self.todos)
-        msg = "All clear!" if count == 0 else f"{count} todo{'s' if count != 1 else ''}"
-        rumps.notification("Digiman", "Refreshed", msg)
+        self.refresh_todos(notify=True)
 
     def on_add_todo(self, _):
         """Add new todo."""
@@ -153,21 +361,27 @@ class DigimanMenuBar(rumps.App):
         response = window.run()
 
         if response.clicked and response.text.strip():
-            try:
-                result = requests.post(
-                    f"{API_BASE}/api/todos",
-                    json={"title": response.text.strip(), "due_date": date.today().isoformat()},
-                    timeout=5
-                )
-                if result.ok:
-                    rumps.notification("Digiman", "✓ Added", response.text.strip()[:30])
-                    self.refresh_todos()
-            except Exception as e:
-                rumps.notification("Digiman", "Error", str(e))
+            title = response.text.strip()
+            self.run_in_background(
+                partial(
+                    self.client.post,
+                    "/api/todos",
+                    content=dumps({"title": title, "due_date": self._today_iso}),
+                    headers=JSON_HEADERS
+                ),
+                partial(self._after_action, subtitle="✓ Added", message=title[:30])
+            )
 
     def on_open_web(self, _):
         """Open web UI."""
-        webbrowser.open(API_BASE)
+        open_url(API_BASE)
+
+    def on_quit(self, _):
+        """Stop background workers and quit."""
+        self._poll_timer.stop()
+        self._pool.shutdown(wait=False)
+        self.client.close()
+        rumps.quit_application()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Standby worker for Python jobs run from the monitor.
+
+Started by monitor_app as `python job_worker.py <fd>`, where fd is one end of
+a socket pair. It imports digiman while idle, then runs the one job sent over
+that connection and sends back its result. Only the stdlib is imported here,
+so an idle worker never loads rumps, AppKit or Flask.
+"""
+
+import io
+import os
+import runpy
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from multiprocessing.connection import Connection
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).parent.parent
+PROJECT_ROOT = str(PROJECT_DIR)
+
+
+class TailBuffer(io.TextIOBase):
+    """Text sink that keeps only the last `limit` characters, teeing to `log`."""
+
+    def __init__(self, limit, log=None):
+        self.limit = limit
+        self.log = log
+        self._tail = ''
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        if self.log:
+            self.log.write(s)
+        self._tail = (self._tail + s)[-self.limit:]
+        return len(s)
+
+    def getvalue(self):
+        return self._tail
+
+
+def warm_up():
+    """Set up the process like a script run from PROJECT_DIR."""
+    os.chdir(PROJECT_DIR)
+    sys.path.insert(0, PROJECT_ROOT)
+    try:
+        import digiman.models  # noqa: F401
+    except Exception:
+        pass  # the job itself will report the import error
+
+
+def run_job_script(path, log_path, limit):
+    """Run a job script as __main__ -> (success, stdout, stderr)."""
+    saved_argv = sys.argv
+    sys.argv = [path]
+    success = True
+    with open(log_path, 'a', encoding='utf-8', errors='replace') as log:
+        out, err = TailBuffer(limit, log), TailBuffer(limit, log)
+        try:
+            with redirect_stdout(out), redirect_stderr(err):
+                runpy.run_path(path, run_name='__main__')
+        except SystemExit as e:
+            success = e.code in (None, 0)
+        except BaseException:
+            success = False
+            err.write(traceback.format_exc())
+        finally:
+            sys.argv = saved_argv
+    return success, out.getvalue(), err.getvalue()
+
+
+def main(fd):
+    """Warm up, run the one job sent over fd, send back its result."""
+    conn = Connection(fd)
+    warm_up()
+    try:
+        path, log_path, limit = conn.recv()
+    except EOFError:
+        return  # the monitor exited before handing us a job
+    conn.send(None)  # started: the job's timeout runs from here
+    conn.send(run_job_script(path, log_path, limit))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]))
@@ -1,24 +1,78 @@
 #!/usr/bin/env python3
 """Digiman Monitor - Separate menu bar app for tracking automations."""
 
+import asyncio
+import gzip
+import hashlib
 import rumps
 import webbrowser
 import json
-import threading
+import os
+import queue
+import re
+import select
+import socket
 import subprocess
+import threading
 import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from flask import Flask, render_template_string, jsonify
+from datetime import datetime, timedelta
+from functools import lru_cache
+from multiprocessing.connection import Connection
+from flask import Flask, Response, request
+from PyObjCTools import AppHelper
+
+try:
+    import orjson  # optional, faster JSON
+except ImportError:
+    orjson = None
+
+try:
+    from waitress import serve  # optional, production WSGI server
+except ImportError:
+    serve = None
+
+try:
+    import minify_html  # optional, smaller dashboard HTML
+except ImportError:
+    minify_html = None
 
 # Configuration
 STATUS_FILE = Path.home() / ".digiman" / "cron_status.json"
+STATUS_PATH = str(STATUS_FILE)  # polled constantly; skip Path conversion each time
 MONITOR_PORT = 5051
 PROJECT_DIR = Path(__file__).parent.parent
+PROJECT_ROOT = str(PROJECT_DIR)  # for argv/cwd, built once
+
+sys.path.insert(0, PROJECT_ROOT)
+from digiman.cron_history import HISTORY_LIMIT, read_history
 
 # Flask app for dashboard
 flask_app = Flask(__name__)
 
+
+def dumps_json(obj):
+    """Serialize obj to JSON bytes, using orjson when available."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode('utf-8')
+
+
+def loads_json(data):
+    """Parse JSON bytes, using orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_response(obj, status=200):
+    """jsonify replacement that serializes with dumps_json."""
+    return Response(dumps_json(obj), status=status, mimetype='application/json')
+
+
+# /api/status payload is reused for STATUS_TTL seconds while STATUS_FILE is unchanged
+STATUS_TTL = 2.0
+_status_cache = {"mtime": None, "payload": None, "expires": 0.0}
+
 DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
@@ -26,8 +80,10 @@ DASHBOARD_HTML = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Digiman Monitor</title>
+    <link rel="preconnect" href="https://cdn.tailwindcss.com">
+    <link rel="preconnect" href="https://unpkg.com">
     <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://unpkg.com/lucide@latest/dist/umd/lucide.min.js"></script>
+    <script src="https://unpkg.com/lucide@0.460.0/dist/umd/lucide.min.js"></script>
     <style>
         body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }
         .pulse { animation: pulse 2s infinite; }
@@ -39,7 +95,7 @@ DASHBOARD_HTML = """
     </style>
 </head>
 <body class="bg-gray-900 text-white min-h-screen">
-    <div class="max-w-4xl mx-auto p-6" x-data="monitorApp()" x-init="loadStatus(); setInterval(() => loadStatus(), 10000)">
+    <div class="max-w-4xl mx-auto p-6" x-data="monitorApp()" x-init="connectEvents(); watchVisibility()">
         <!-- Header -->
         <div class="flex items-center justify-between mb-8">
             <div class="flex items-center gap-4">
@@ -55,7 +111,7 @@ DASHBOARD_HTML = """
                 <button @click="loadStatus()" class="p-2 text-gray-400 hover:text-white transition-colors" title="Refresh now">
                     <i data-lucide="refresh-cw" class="w-4 h-4"></i>
                 </button>
-                <span class="text-xs text-gray-500">Auto: 10s</span>
+                <span class="text-xs text-gray-500">Live</span>
                 <button @click="runAllJobs()"
                         :disabled="isRunning"
                         class="px-4 py-2 bg-yellow-500 text-black rounded-lg font-medium hover:bg-yellow-400 transition-colors disabled:opacity-50 flex items-center gap-2">
@@ -286,8 +342,8 @@ DASHBOARD_HTML = """
         </div>
     </div>
 
-    <script src="https://unpkg.com/alpinejs@3.x.x/dist/cdn.min.js" defer></script>
-    <script src="https://unpkg.com/@alpinejs/collapse@3.x.x/dist/cdn.min.js" defer></script>
+    <script src="https://unpkg.com/@alpinejs/collapse@3.14.1/dist/cdn.min.js" defer></script>
+    <script src="https://unpkg.com/alpinejs@3.14.1/dist/cdn.min.js" defer></script>
     <script>
         function monitorApp() {
             return {
@@ -311,10 +367,11 @@ DASHBOARD_HTML = """
                 showLogs: false,
                 selectedLogFile: 'smartpaste',
                 logContent: '',
+                logOffset: null,
 
                 get filteredHistory() {
-                    // Filter out 'running' status entries
-                    return (this.status.history || []).filter(e => e.status !== 'running');
+                    // The server already drops 'running' entries and caps the list
+                    return this.status.history;
                 },
 
                 formatTimeAgo(timestamp) {
@@ -388,63 +445,118 @@ DASHBOARD_HTML = """
                 },
 
                 async loadLogs() {
+                    this.logOffset = null;
                     try {
                         const response = await fetch(`/api/logs/${this.selectedLogFile}`);
                         const data = await response.json();
                         this.logContent = data.content || 'No logs available';
+                        this.logOffset = data.offset ?? null;
                     } catch (error) {
                         this.logContent = 'Failed to load logs: ' + error.message;
                     }
                 },
 
+                async appendLogs() {
+                    // Only fetch what was written since the last load
+                    try {
+                        const response = await fetch(`/api/logs/${this.selectedLogFile}?since=${this.logOffset}`);
+                        const data = await response.json();
+                        if (data.offset === undefined) return;
+                        if (data.append) {
+                            // The tail is sent without its final newline
+                            if (data.content) this.logContent += '\\n' + data.content.replace(/\\n$/, '');
+                        } else {
+                            this.logContent = data.content || 'No logs available';
+                        }
+                        this.logOffset = data.offset;
+                    } catch (error) {
+                        console.error('Failed to load logs:', error);
+                    }
+                },
+
                 async loadStatus() {
                     try {
                         const response = await fetch('/api/status');
-                        const data = await response.json();
+                        this.updateStatus(await response.json());
+                    } catch (error) {
+                        console.error('Failed to load status:', error);
+                    }
+                },
 
-                        // Update status
-                        this.status.last_sync = data.last_sync;
-                        this.status.last_sync_ago = data.last_sync_ago || 'Never';
-                        this.status.items_today = data.last_sync_count || 0;
-                        this.status.history = data.history || [];
-                        this.status.all_healthy = data.last_sync_status !== 'error';
-
-                        // Update backfill and claude_code status
-                        this.status.backfill = data.backfill || { pending_days: 0, meetings_pending: 0 };
-                        this.status.claude_code = data.claude_code || { available: false };
-
-                        // Update upcoming schedule times
-                        this.status.next_smart_paste = data.next_smart_paste;
-                        this.status.next_nightly_sync = data.next_nightly_sync;
-                        this.status.next_morning_push = data.next_morning_push;
-
-                        // Update job statuses from server data
-                        if (data.jobs) {
-                            for (const job of this.status.jobs) {
-                                const serverJob = data.jobs[job.id];
-                                if (serverJob) {
-                                    job.status = serverJob.last_status || 'pending';
-                                    job.last_run = serverJob.last_run;
-                                    job.last_message = serverJob.last_message;
-                                    job.last_count = serverJob.last_count;
-                                }
-                            }
+                connectEvents() {
+                    // The server pushes a fresh status whenever the cron rewrites it
+                    this._events = new EventSource('/api/events');
+                    this._events.onmessage = (e) => this.updateStatus(JSON.parse(e.data));
+                },
+
+                watchVisibility() {
+                    // Background tabs drop the stream; it reconnects (and resends status) on return
+                    document.addEventListener('visibilitychange', () => {
+                        if (document.hidden) {
+                            this._events?.close();
+                            this._events = null;
+                        } else if (!this._events) {
+                            this.connectEvents();
                         }
+                    });
+                },
 
-                        // Fallback for legacy data format
-                        if (!data.jobs) {
-                            if (data.granola_enabled !== undefined) {
-                                this.status.jobs[2].status = data.granola_enabled ? 'success' : 'pending';
-                            }
-                            if (data.morning_push_enabled !== undefined) {
-                                this.status.jobs[3].status = data.morning_push_enabled ? 'success' : 'pending';
+                updateStatus(data) {
+                    // A status change usually means a job just wrote to its log
+                    if (this.showLogs && this.logOffset !== null) this.appendLogs();
+
+                    // Update status
+                    this.status.last_sync = data.last_sync;
+                    this.status.last_sync_ago = data.last_sync_ago || 'Never';
+                    this.status.items_today = data.last_sync_count || 0;
+                    this.status.history = data.history || [];
+                    this.status.all_healthy = data.last_sync_status !== 'error';
+
+                    // Update backfill and claude_code status
+                    this.status.backfill = data.backfill || { pending_days: 0, meetings_pending: 0 };
+                    this.status.claude_code = data.claude_code || { available: false };
+
+                    // Update upcoming schedule times
+                    this.status.next_smart_paste = data.next_smart_paste;
+                    this.status.next_nightly_sync = data.next_nightly_sync;
+                    this.status.next_morning_push = data.next_morning_push;
+
+                    // Update job statuses from server data
+                    if (data.jobs) {
+                        for (const job of this.status.jobs) {
+                            const serverJob = data.jobs[job.id];
+                            if (serverJob) {
+                                job.status = serverJob.last_status || 'pending';
+                                job.last_run = serverJob.last_run;
+                                job.last_message = serverJob.last_message;
+                                job.last_count = serverJob.last_count;
                             }
                         }
+                    }
 
-                        // Re-init icons
-                        this.$nextTick(() => lucide.createIcons());
-                    } catch (error) {
-                        console.error('Failed to load status:', error);
+                    // Fallback for legacy data format
+                    if (!data.jobs) {
+                        if (data.granola_enabled !== undefined) {
+                            this.status.jobs[2].status = data.granola_enabled ? 'success' : 'pending';
+                        }
+                        if (data.morning_push_enabled !== undefined) {
+                            this.status.jobs[3].status = data.morning_push_enabled ? 'success' : 'pending';
+                        }
+                    }
+
+                    // Re-init icons
+                    this.$nextTick(() => lucide.createIcons());
+                },
+
+                async startRun(jobId) {
+                    // Jobs run in the background; poll until this run finishes
+                    const response = await fetch(`/api/run/${jobId}`, { method: 'POST' });
+                    const { run_id, error } = await response.json();
+                    if (!run_id) return { success: false, error };
+                    while (true) {
+                        await new Promise(resolve => setTimeout(resolve, 1000));
+                        const data = await (await fetch(`/api/run/status/${run_id}`)).json();
+                        if (data.done) return data;
                     }
                 },
 
@@ -453,8 +565,7 @@ DASHBOARD_HTML = """
                     if (job) job.running = true;
 
                     try {
-                        const response = await fetch(`/api/run/${jobId}`, { method: 'POST' });
-                        const data = await response.json();
+                        const data = await this.startRun(jobId);
                         this.showToast(data.success ? `✓ ${job.name} completed` : `✗ ${data.error}`);
                         await this.loadStatus();
                     } catch (error) {
@@ -467,8 +578,7 @@ DASHBOARD_HTML = """
                 async runAllJobs() {
                     this.isRunning = true;
                     try {
-                        const response = await fetch('/api/run/all', { method: 'POST' });
-                        const data = await response.json();
+                        const data = await this.startRun('all');
                         this.showToast(data.success ? `✓ Sync complete: ${data.new_todos || 0} items` : `✗ ${data.error}`);
                         await this.loadStatus();
                     } catch (error) {
@@ -489,18 +599,144 @@ DASHBOARD_HTML = """
 </html>
 """
 
+def minify_dashboard(html):
+    """Shrink the dashboard once at import; the page has no template variables."""
+    if minify_html:
+        return minify_html.minify(html, minify_js=True, minify_css=True)
+    # Fallback: drop indentation, blank lines and whole-line comments. Newlines
+    # stay so the inline JS never depends on them being removed safely.
+    html = re.sub(r'<!--.*?-->', '', html, flags=re.S)
+    lines = (line.strip() for line in html.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+DASHBOARD_BYTES = minify_dashboard(DASHBOARD_HTML).encode('utf-8')
+DASHBOARD_ETAG = f'"{hashlib.md5(DASHBOARD_BYTES).hexdigest()}"'
+DASHBOARD_GZIP = gzip.compress(DASHBOARD_BYTES, 9)
+
+# Text responses at least this big are gzipped when the client accepts it
+COMPRESS_MIMETYPES = {'text/html', 'application/json', 'text/plain'}
+COMPRESS_MIN_BYTES = 500
+COMPRESS_LEVEL = 6
+
+def accepts_gzip():
+    return 'gzip' in request.headers.get('Accept-Encoding', '')
+
+@flask_app.after_request
+def compress_response(response):
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or response.mimetype not in COMPRESS_MIMETYPES
+        or 'Content-Encoding' in response.headers
+    ):
+        return response
+    response.vary.add('Accept-Encoding')
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_BYTES or not accepts_gzip():
+        return response
+    response.set_data(gzip.compress(body, COMPRESS_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
 @flask_app.route('/')
 def dashboard():
-    return render_template_string(DASHBOARD_HTML)
+    headers = {'ETag': DASHBOARD_ETAG, 'Cache-Control': 'public, max-age=60', 'Vary': 'Accept-Encoding'}
+    if request.headers.get('If-None-Match') == DASHBOARD_ETAG:
+        return Response(status=304, headers=headers)
+    if accepts_gzip():
+        headers['Content-Encoding'] = 'gzip'
+        return Response(DASHBOARD_GZIP, mimetype='text/html', headers=headers)
+    return Response(DASHBOARD_BYTES, mimetype='text/html', headers=headers)
 
 @flask_app.route('/api/status')
 def api_status():
+    return Response(
+        status_payload(),
+        mimetype='application/json',
+        headers={'Cache-Control': 'max-age=2, stale-while-revalidate=8'}
+    )
+
+def status_payload():
+    """Serialized build_status(), reused while STATUS_FILE is unchanged."""
+    mtime = _status_mtime()
+    now = time.monotonic()
+    if _status_cache["payload"] is None or _status_cache["mtime"] != mtime or now >= _status_cache["expires"]:
+        payload = dumps_json(build_status())
+        _status_cache.update(mtime=mtime, payload=payload, expires=now + STATUS_TTL)
+    return _status_cache["payload"]
+
+# /api/events: one thread watches STATUS_FILE and fans changes out to every
+# connected dashboard, instead of each tab polling /api/status
+EVENTS_POLL_SECONDS = 1.0
+EVENTS_KEEPALIVE_SECONDS = 15
+EVENTS_REFRESH_SECONDS = 60
+_event_subscribers = set()
+_event_lock = threading.Lock()
+_event_thread = None
+
+def _status_mtime():
+    try:
+        return os.stat(STATUS_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+def _publish_status_changes(last_mtime):
+    last_push = time.monotonic()
+    while True:
+        time.sleep(EVENTS_POLL_SECONDS)
+        mtime = _status_mtime()
+        # Unchanged files are still re-sent now and then: "ago" and next-run
+        # labels are relative to the current time
+        if mtime == last_mtime and time.monotonic() - last_push < EVENTS_REFRESH_SECONDS:
+            continue
+        last_mtime = mtime
+        last_push = time.monotonic()
+        payload = status_payload()
+        with _event_lock:
+            for q in _event_subscribers:
+                q.put(payload)
+
+@flask_app.route('/api/events')
+def api_events():
+    global _event_thread
+    q = queue.Queue()
+    with _event_lock:
+        if _event_thread is None:
+            _event_thread = threading.Thread(
+                target=_publish_status_changes, args=(_status_mtime(),), daemon=True
+            )
+            _event_thread.start()
+        _event_subscribers.add(q)
+    q.put(status_payload())
+
+    def stream():
+        try:
+            while True:
+                try:
+                    payload = q.get(timeout=EVENTS_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    yield b': keepalive\n\n'
+                    continue
+                yield b'data: ' + payload + b'\n\n'
+        finally:
+            with _event_lock:
+                _event_subscribers.discard(q)
+
+    return Response(stream(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
+def build_status():
+    """Status file contents plus last-sync age and upcoming schedule."""
     status = load_status()
 
+    # Only the most recent finished runs are shown (history is newest first)
+    history = status.get('history') or []
+    status['history'] = [e for e in history if e.get('status') != 'running'][:HISTORY_LIMIT]
+
     # Calculate time ago
     if status.get('last_sync'):
         try:
-            dt = datetime.fromisoformat(status['last_sync'])
+            dt = parse_timestamp(status['last_sync'])
             status['last_sync_ago'] = time_ago(dt)
         except:
             status['last_sync_ago'] = 'Unknown'
@@ -511,61 +747,193 @@ def api_status():
     status['next_nightly_sync'] = next_sync
     status['next_morning_push'] = next_push
 
-    return jsonify(status)
-
-@flask_app.route('/api/run/<job_id>', methods=['POST'])
-def api_run_job(job_id):
+    return status
+
+# job_id -> (argv, timeout in seconds)
+JOBS = {
+    'smart_paste': (
+        [sys.executable, f'{PROJECT_ROOT}/scripts/smart_paste/smart_paste_sync.py'],
+        300,  # 5 minute timeout for Claude processing
+    ),
+    'watchdog': (['bash', f'{PROJECT_ROOT}/scripts/smart_paste/watchdog.sh'], 60),
+    'nightly': ([sys.executable, f'{PROJECT_ROOT}/scripts/nightly_sync.py'], 120),
+    # Up to 4 attempts with 5/15/45s (+20% jitter) backoff and 10s Slack calls
+    'morning_push': ([sys.executable, f'{PROJECT_ROOT}/scripts/morning_push.py'], 240),
+}
+# job_id -> LOG_FILES key that scheduled runs of the same job write to
+JOB_LOGS = {'smart_paste': 'smartpaste', 'watchdog': 'watchdog', 'nightly': 'nightly', 'morning_push': 'morning'}
+# Granola/Slack/all run as part of the nightly sync
+JOBS['all'] = JOBS['granola'] = JOBS['slack'] = JOBS['nightly']
+JOB_LOGS['all'] = JOB_LOGS['granola'] = JOB_LOGS['slack'] = JOB_LOGS['nightly']
+
+# A run's full output goes to its log; only this much of each stream's
+# tail is kept in memory and returned to the dashboard
+JOB_OUTPUT_BYTES = 16 * 1024
+
+
+def start_job_log(job_id):
+    """Mark the start of a manual run in job_id's log and return the log's path."""
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_path = LOG_DIR / LOG_FILES[JOB_LOGS[job_id]]
+    with open(log_path, 'a', encoding='utf-8') as log:
+        log.write(f"\n--- {job_id} run from monitor at {datetime.now():%Y-%m-%d %H:%M:%S} ---\n")
+    return log_path
+
+
+# Each Python job runs in its own process, so a timeout kills only that job.
+# Processes are started ahead of time and import digiman while idle, so a
+# click doesn't pay for interpreter startup and imports every time. They run
+# job_worker.py (stdlib only), never this module, so they stay small.
+JOB_WORKER = str(Path(__file__).with_name('job_worker.py'))
+JOB_STANDBY_WORKERS = 2
+JOB_START_TIMEOUT = 60  # seconds a worker may take to import digiman
+_standby_workers = []  # (Popen, Connection) warmed up and waiting for a job
+_standby_lock = threading.Lock()
+
+
+def _start_job_worker():
+    parent_sock, child_sock = socket.socketpair()
+    with child_sock:
+        fd = child_sock.fileno()
+        proc = subprocess.Popen(
+            [sys.executable, JOB_WORKER, str(fd)],
+            pass_fds=(fd,),
+            stdin=subprocess.DEVNULL,
+            cwd=PROJECT_ROOT
+        )
+    return proc, Connection(parent_sock.detach())
+
+
+def take_job_worker():
+    """Hand out a warm worker for one job and top the standby set back up."""
+    with _standby_lock:
+        worker = None
+        while _standby_workers and worker is None:
+            proc, conn = _standby_workers.pop()
+            if proc.poll() is None:
+                worker = (proc, conn)
+            else:
+                conn.close()
+        while len(_standby_workers) < JOB_STANDBY_WORKERS:
+            _standby_workers.append(_start_job_worker())
+    return worker or _start_job_worker()
+
+
+def run_python_job(job_id):
+    """Run a Python job in its own warm worker, blocking -> (success, stdout, stderr).
+
+    The timeout starts once the worker has warmed up and picked the job up.
+    Raises TimeoutError (after killing that worker only) if it overruns.
+    """
+    argv, timeout = JOBS[job_id]
+    log_path = start_job_log(job_id)
+    proc, conn = take_job_worker()
     try:
-        if job_id == 'smart_paste':
-            # Run SMART_PASTE sync
-            result = subprocess.run(
-                [sys.executable, str(PROJECT_DIR / 'scripts' / 'smart_paste' / 'smart_paste_sync.py')],
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout for Claude processing
-                cwd=str(PROJECT_DIR)
-            )
-            return jsonify({'success': result.returncode == 0, 'output': result.stdout, 'error': result.stderr})
-
-        elif job_id == 'watchdog':
-            # Run watchdog check
-            result = subprocess.run(
-                ['bash', str(PROJECT_DIR / 'scripts' / 'smart_paste' / 'watchdog.sh')],
-                capture_output=True,
-                text=True,
-                timeout=60,
-                cwd=str(PROJECT_DIR)
-            )
-            return jsonify({'success': result.returncode == 0, 'output': result.stdout, 'error': result.stderr})
-
-        elif job_id == 'all' or job_id == 'nightly' or job_id == 'granola' or job_id == 'slack':
-            # Run nightly sync
-            result = subprocess.run(
-                [sys.executable, str(PROJECT_DIR / 'scripts' / 'nightly_sync.py')],
-                capture_output=True,
-                text=True,
-                timeout=120,
-                cwd=str(PROJECT_DIR)
-            )
-            return jsonify({'success': result.returncode == 0, 'output': result.stdout, 'error': result.stderr})
-
-        elif job_id == 'morning_push':
-            result = subprocess.run(
-                [sys.executable, str(PROJECT_DIR / 'scripts' / 'morning_push.py')],
-                capture_output=True,
-                text=True,
-                timeout=60,
-                cwd=str(PROJECT_DIR)
+        conn.send((argv[1], str(log_path), JOB_OUTPUT_BYTES))
+        started = conn.poll(JOB_START_TIMEOUT)
+        if started:
+            try:
+                conn.recv()
+            except EOFError:
+                pass  # worker died while warming up; reported below
+        if not started or not conn.poll(timeout):
+            proc.kill()
+            raise TimeoutError(f"{job_id} timed out after {timeout}s")
+        try:
+            return conn.recv()
+        except EOFError:
+            return False, '', f"{job_id} worker exited unexpectedly (exit code {proc.wait()})"
+    finally:
+        conn.close()
+        proc.wait()
+
+async def read_tail(stream, log):
+    """Copy stream into log, returning its last JOB_OUTPUT_BYTES as text."""
+    tail = bytearray()
+    while chunk := await stream.read(65536):
+        log.write(chunk)
+        tail += chunk
+        del tail[:-JOB_OUTPUT_BYTES]
+    return tail.decode(errors='replace')
+
+async def run_subprocess_job(job_id):
+    """Run a non-Python job (e.g. the bash watchdog) -> (success, stdout, stderr)."""
+    argv, timeout = JOBS[job_id]
+    log_path = start_job_log(job_id)
+
+    with open(log_path, 'ab') as log:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=PROJECT_ROOT
+        )
+        try:
+            output, error = await asyncio.wait_for(
+                asyncio.gather(read_tail(proc.stdout, log), read_tail(proc.stderr, log)),
+                timeout=timeout
             )
-            return jsonify({'success': result.returncode == 0, 'output': result.stdout, 'error': result.stderr})
+            await proc.wait()
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise TimeoutError(f"{job_id} timed out after {timeout}s")
 
-        else:
-            return jsonify({'success': False, 'error': 'Unknown job'})
+    return proc.returncode == 0, output, error
 
-    except subprocess.TimeoutExpired:
-        return jsonify({'success': False, 'error': 'Job timed out'})
+def run_job(job_id):
+    """Run job_id to completion (blocking) -> result dict for the dashboard."""
+    argv, _ = JOBS[job_id]
+    try:
+        if argv[0] == sys.executable:
+            success, output, error = run_python_job(job_id)
+        else:
+            success, output, error = asyncio.run(run_subprocess_job(job_id))
+    except TimeoutError:
+        return {'success': False, 'error': 'Job timed out'}
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+        return {'success': False, 'error': str(e)}
+    return {'success': success, 'output': output, 'error': error}
+
+# Dashboard runs happen in the background; the client polls /api/run/status/<run_id>
+_run_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='job')
+_runs = {}  # run_id -> Future of run_job()
+_run_finished = {}  # run_id -> time.monotonic() when its job finished
+# Results nobody collects (tab closed, poll failed) are dropped after this long
+RUN_RESULT_TTL = 300
+
+def _evict_stale_runs():
+    cutoff = time.monotonic() - RUN_RESULT_TTL
+    for run_id, finished in list(_run_finished.items()):
+        if finished < cutoff:
+            _runs.pop(run_id, None)
+            _run_finished.pop(run_id, None)
+
+@flask_app.route('/api/run/<job_id>', methods=['POST'])
+def api_run_job(job_id):
+    if job_id not in JOBS:
+        return json_response({'success': False, 'error': 'Unknown job'})
+
+    _evict_stale_runs()
+    run_id = uuid.uuid4().hex
+    future = _run_executor.submit(run_job, job_id)
+    _runs[run_id] = future
+    future.add_done_callback(lambda _: _run_finished.__setitem__(run_id, time.monotonic()))
+    return json_response({'run_id': run_id}, 202)
+
+@flask_app.route('/api/run/status/<run_id>')
+def api_run_status(run_id):
+    _evict_stale_runs()
+    future = _runs.get(run_id)
+    if future is None:
+        return json_response({'done': True, 'success': False, 'error': 'Unknown run'}, 404)
+    if not future.done():
+        return json_response({'done': False})
+    # each result is collected once
+    del _runs[run_id]
+    _run_finished.pop(run_id, None)
+    return json_response({'done': True, **future.result()})
 
 LOG_DIR = Path.home() / ".digiman" / "logs"
 LOG_FILES = {
@@ -575,98 +943,213 @@ LOG_FILES = {
     'morning': 'morning.log'
 }
 
+# Only this much of the end of a log is read to find its last lines
+LOG_TAIL_BYTES = 64 * 1024
+_log_tail_cache = {}  # log path -> ((mtime_ns, size), tail text)
+
+def tail_log(log_file, max_lines=100):
+    """Return (last max_lines of log_file, byte offset they end at).
+
+    Reads at most LOG_TAIL_BYTES, never the whole file.
+    """
+    st = log_file.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _log_tail_cache.get(log_file)
+    if cached and cached[0] == key:
+        return cached[1], st.st_size
+
+    start = max(0, st.st_size - LOG_TAIL_BYTES)
+    with log_file.open('rb') as f:
+        f.seek(start)
+        chunk = f.read(st.st_size - start)
+
+    lines = chunk.strip().split(b'\n')
+    if st.st_size > LOG_TAIL_BYTES:
+        lines = lines[1:]  # first line is probably cut off
+    text = b'\n'.join(lines[-max_lines:]).decode('utf-8', errors='replace')
+    _log_tail_cache[log_file] = (key, text)
+    return text, st.st_size
+
+def read_log_since(log_file, offset):
+    """Return (bytes appended after offset, new offset), or None if the viewer
+    should reload the tail instead (file truncated/rotated or too far behind)."""
+    size = log_file.stat().st_size
+    if offset > size or size - offset > LOG_TAIL_BYTES:
+        return None
+    with log_file.open('rb') as f:
+        f.seek(offset)
+        chunk = f.read(size - offset)
+    return chunk.decode('utf-8', errors='replace'), offset + len(chunk)
+
 @flask_app.route('/api/logs/<log_name>')
 def api_logs(log_name):
-    """Get recent log content."""
+    """Get recent log content, or only what was appended after ?since=<offset>."""
     if log_name not in LOG_FILES:
-        return jsonify({'error': 'Unknown log file'}), 404
+        return json_response({'error': 'Unknown log file'}, 404)
 
     log_file = LOG_DIR / LOG_FILES[log_name]
 
     if not log_file.exists():
-        return jsonify({'content': f'No log file found at {log_file}'})
+        return json_response({'content': f'No log file found at {log_file}'})
 
     try:
-        # Read last 100 lines
-        content = log_file.read_text()
-        lines = content.strip().split('\n')
-        recent_lines = lines[-100:] if len(lines) > 100 else lines
-        return jsonify({'content': '\n'.join(recent_lines)})
+        since = request.args.get('since', type=int)
+        if since is not None:
+            appended = read_log_since(log_file, since)
+            if appended:
+                content, offset = appended
+                return json_response({'content': content, 'offset': offset, 'append': True})
+        content, offset = tail_log(log_file)
+        return json_response({'content': content, 'offset': offset})
     except Exception as e:
-        return jsonify({'content': f'Error reading log: {e}'})
+        return json_response({'content': f'Error reading log: {e}'})
 
 @flask_app.route('/api/logs/<log_name>/download')
 def api_logs_download(log_name):
-    """Download full log file."""
-    from flask import send_file
+    """Download full log file (supports If-None-Match/If-Modified-Since and Range)."""
+    from flask import send_from_directory
 
     if log_name not in LOG_FILES:
-        return jsonify({'error': 'Unknown log file'}), 404
+        return json_response({'error': 'Unknown log file'}, 404)
 
     log_file = LOG_DIR / LOG_FILES[log_name]
 
     if not log_file.exists():
-        return jsonify({'error': 'Log file not found'}), 404
+        return json_response({'error': 'Log file not found'}, 404)
+
+    return send_from_directory(
+        LOG_DIR,
+        LOG_FILES[log_name],
+        as_attachment=True,
+        download_name=LOG_FILES[log_name],
+        conditional=True,
+        etag=True,
+        max_age=0
+    )
 
-    return send_file(log_file, as_attachment=True, download_name=LOG_FILES[log_name])
+# Parsed STATUS_FILE, keyed by (mtime_ns, size)
+_status_mem = {"key": None, "data": {}}
 
 def load_status():
+    """Return a copy of the parsed status file, re-reading it only when it changes."""
     try:
-        if STATUS_FILE.exists():
-            return json.loads(STATUS_FILE.read_text())
-    except:
-        pass
-    return {}
+        st = os.stat(STATUS_PATH)
+    except OSError:
+        return {}
 
-def time_ago(dt):
-    now = datetime.now()
-    diff = now - dt
-    seconds = diff.total_seconds()
-
-    if seconds < 60:
-        return "just now"
-    elif seconds < 3600:
-        mins = int(seconds / 60)
-        return f"{mins}m ago"
-    elif seconds < 86400:
-        hours = int(seconds / 3600)
-        return f"{hours}h ago"
+    key = (st.st_mtime_ns, st.st_size)
+    if _status_mem["key"] != key:
+        try:
+            with open(STATUS_PATH, 'rb') as f:
+                data = loads_json(f.read())
+        except (OSError, json.JSONDecodeError):
+            # Likely caught mid-write; keep serving the last good copy
+            return dict(_status_mem["data"])
+        # Writers append the run to the history sidecar before rewriting the status file
+        data['history'] = read_history() or data.get('history') or []
+        _status_mem.update(key=key, data=data)
+
+    # Callers add derived keys, so never hand out the cached dict itself
+    return dict(_status_mem["data"])
+
+SERVER_THREADS = 8  # each open dashboard holds one for its /api/events stream
+
+def run_server():
+    """Serve the dashboard on localhost, with waitress when it is installed."""
+    if serve:
+        serve(flask_app, host='127.0.0.1', port=MONITOR_PORT, threads=SERVER_THREADS, ident=None)
     else:
-        days = int(seconds / 86400)
-        return f"{days}d ago"
+        flask_app.run(port=MONITOR_PORT, debug=False, use_reloader=False, threaded=True)
+
+
+def watch_status_file(on_change):
+    """Call on_change() each time the cron rewrites STATUS_FILE.
+
+    Blocks on a kqueue vnode filter (macOS), so nothing runs between
+    writes. Reopens the file if it is deleted or replaced.
+    """
+    kq = select.kqueue()
+    replaced = select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME
+    while True:
+        try:
+            fd = os.open(STATUS_PATH, os.O_RDONLY)
+        except FileNotFoundError:
+            time.sleep(5)
+            continue
+
+        try:
+            kq.control([select.kevent(
+                fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND | replaced,
+            )], 0)
+            while True:
+                events = kq.control(None, 1)
+                on_change()
+                if any(e.fflags & replaced for e in events):
+                    break
+        finally:
+            os.close(fd)
+
+
+@lru_cache(maxsize=1)
+def parse_timestamp(value):
+    """datetime.fromisoformat, remembered for the latest value (last_sync rarely changes)."""
+    return datetime.fromisoformat(value)
+
+
+# (under this many seconds, unit in seconds, suffix); unit None = fixed text
+TIME_AGO_STEPS = (
+    (60, None, "just now"),
+    (3600, 60, "m ago"),
+    (86400, 3600, "h ago"),
+    (float("inf"), 86400, "d ago"),
+)
+
+def time_ago(dt):
+    secs = int((datetime.now() - dt).total_seconds())
+    for limit, unit, suffix in TIME_AGO_STEPS:
+        if secs < limit:
+            return suffix if unit is None else f"{secs // unit}{suffix}"
+
+
+# Daily (hour, minute) of SMART_PASTE, nightly sync and morning push
+SCHEDULE = ((1, 30), (1, 30), (8, 0))
 
+# Formatted schedule, valid until the next job time or midnight
+_sched_cache = {"expires": 0.0, "value": None}
+
+def format_run_time(dt, today, tomorrow):
+    if dt.date() == today:
+        return f"Today {dt.strftime('%I:%M %p')}"
+    elif dt.date() == tomorrow:
+        return f"Tomorrow {dt.strftime('%I:%M %p')}"
+    else:
+        return dt.strftime('%b %d %I:%M %p')
 
 def get_next_scheduled_times():
     """Calculate next scheduled sync times."""
-    from datetime import timedelta
+    if time.time() < _sched_cache["expires"]:
+        return _sched_cache["value"]
 
     now = datetime.now()
+    today = now.date()
+    tomorrow = today + timedelta(days=1)
 
-    # SMART_PASTE at 1:30 AM
-    smart_paste = now.replace(hour=1, minute=30, second=0, microsecond=0)
-    if now >= smart_paste:
-        smart_paste += timedelta(days=1)
-
-    # Nightly sync at 1:30 AM
-    nightly = now.replace(hour=1, minute=30, second=0, microsecond=0)
-    if now >= nightly:
-        nightly += timedelta(days=1)
-
-    # Morning push at 8 AM
-    morning = now.replace(hour=8, minute=0, second=0, microsecond=0)
-    if now >= morning:
-        morning += timedelta(days=1)
-
-    # Format nicely
-    def format_time(dt):
-        if dt.date() == now.date():
-            return f"Today {dt.strftime('%I:%M %p')}"
-        elif dt.date() == (now + timedelta(days=1)).date():
-            return f"Tomorrow {dt.strftime('%I:%M %p')}"
-        else:
-            return dt.strftime('%b %d %I:%M %p')
+    runs = []
+    for hour, minute in SCHEDULE:
+        run = datetime(now.year, now.month, now.day, hour, minute)
+        if now >= run:
+            run += timedelta(days=1)
+        runs.append(run)
+
+    value = tuple(format_run_time(run, today, tomorrow) for run in runs)
 
-    return format_time(smart_paste), format_time(nightly), format_time(morning)
+    # "Today"/"Tomorrow" labels also flip at midnight
+    midnight = datetime(tomorrow.year, tomorrow.month, tomorrow.day)
+    _sched_cache.update(expires=min(*runs, midnight).timestamp(), value=value)
+    return value
 
 
 class DigimanMonitor(rumps.App):
@@ -676,16 +1159,21 @@ class DigimanMonitor(rumps.App):
         self.start_flask()
         self.build_menu()
 
+        # Refresh the menu whenever the cron writes a new status
+        self.watching_status = hasattr(select, "kqueue")
+        if self.watching_status:
+            threading.Thread(
+                target=watch_status_file, args=(self.on_status_changed,), daemon=True
+            ).start()
+
     def start_flask(self):
         """Start Flask server in background thread."""
-        def run():
-            flask_app.run(port=MONITOR_PORT, debug=False, use_reloader=False)
-
-        self.flask_thread = threading.Thread(target=run, daemon=True)
+        self.flask_thread = threading.Thread(target=run_server, daemon=True)
         self.flask_thread.start()
 
     def build_menu(self):
         status = load_status()
+        items = []
 
         # Check watchdog status
         watchdog_active = status.get('jobs', {}).get('watchdog', {}).get('last_status') == 'triggered'
@@ -693,38 +1181,50 @@ class DigimanMonitor(rumps.App):
         # Status indicator
         if status.get('last_sync_status') == 'error':
             self.title = "⚡❌"
-            self.menu.add(rumps.MenuItem("❌ Last sync failed", callback=None))
+            items.append(rumps.MenuItem("❌ Last sync failed", callback=None))
         elif watchdog_active:
             self.title = "⚡🐕"
-            self.menu.add(rumps.MenuItem("🐕 Watchdog active - catch-up in progress", callback=None))
+            items.append(rumps.MenuItem("🐕 Watchdog active - catch-up in progress", callback=None))
         elif status.get('last_sync'):
             self.title = "⚡"
             try:
-                dt = datetime.fromisoformat(status['last_sync'])
+                dt = parse_timestamp(status['last_sync'])
                 ago = time_ago(dt)
-                self.menu.add(rumps.MenuItem(f"✓ Last sync: {ago}", callback=None))
+                items.append(rumps.MenuItem(f"✓ Last sync: {ago}", callback=None))
             except:
-                self.menu.add(rumps.MenuItem("✓ Synced", callback=None))
+                items.append(rumps.MenuItem("✓ Synced", callback=None))
         else:
             self.title = "⚡"
-            self.menu.add(rumps.MenuItem("No syncs yet", callback=None))
+            items.append(rumps.MenuItem("No syncs yet", callback=None))
 
-        self.menu.add(None)
+        items.append(None)
 
         # Upcoming schedule
         next_smart_paste, next_sync, next_push = get_next_scheduled_times()
-        self.menu.add(rumps.MenuItem("📅 Schedule", callback=None))
-        self.menu.add(rumps.MenuItem(f"   🧠 SMART_PASTE: {next_smart_paste}", callback=None))
-        self.menu.add(rumps.MenuItem(f"   🐕 Watchdog: Active", callback=None))
-        self.menu.add(rumps.MenuItem(f"   📝 Nightly: {next_sync}", callback=None))
-        self.menu.add(rumps.MenuItem(f"   🌅 Morning: {next_push}", callback=None))
-
-        self.menu.add(None)
-        self.menu.add(rumps.MenuItem("📊 Open Dashboard", callback=self.open_dashboard))
-        self.menu.add(rumps.MenuItem("▶️ Run SMART_PASTE Now", callback=self.run_smart_paste))
-        self.menu.add(rumps.MenuItem("▶️ Run Full Sync Now", callback=self.run_sync))
-        self.menu.add(None)
-        self.menu.add(rumps.MenuItem("🧠 Open Digiman", callback=self.open_digiman))
+        items += [
+            rumps.MenuItem("📅 Schedule", callback=None),
+            rumps.MenuItem(f"   🧠 SMART_PASTE: {next_smart_paste}", callback=None),
+            rumps.MenuItem(f"   🐕 Watchdog: Active", callback=None),
+            rumps.MenuItem(f"   📝 Nightly: {next_sync}", callback=None),
+            rumps.MenuItem(f"   🌅 Morning: {next_push}", callback=None),
+            None,
+            rumps.MenuItem("📊 Open Dashboard", callback=self.open_dashboard),
+            rumps.MenuItem("▶️ Run SMART_PASTE Now", callback=self.run_smart_paste),
+            rumps.MenuItem("▶️ Run Full Sync Now", callback=self.run_sync),
+            None,
+            rumps.MenuItem("🧠 Open Digiman", callback=self.open_digiman),
+        ]
+
+        # One update() call instead of an add() per item
+        self.menu.update(items)
+
+    def on_status_changed(self):
+        """Rebuild the menu on the main thread after STATUS_FILE changes."""
+        AppHelper.callAfter(self.rebuild_menu)
+
+    def rebuild_menu(self):
+        self.menu.clear()
+        self.build_menu()
 
     def open_dashboard(self, _):
         webbrowser.open(f"http://localhost:{MONITOR_PORT}")
@@ -737,23 +1237,17 @@ class DigimanMonitor(rumps.App):
 
         def sync():
             try:
-                result = subprocess.run(
-                    [sys.executable, str(PROJECT_DIR / 'scripts' / 'smart_paste' / 'smart_paste_sync.py')],
-                    capture_output=True,
-                    text=True,
-                    timeout=300,  # 5 minute timeout for Claude processing
-                    cwd=str(PROJECT_DIR)
-                )
-                if result.returncode == 0:
+                success, _, error = run_python_job('smart_paste')
+                if success:
                     rumps.notification("Digiman Monitor", "✓ SMART_PASTE complete", "Check dashboard for details")
                 else:
-                    rumps.notification("Digiman Monitor", "✗ SMART_PASTE failed", result.stderr[:100] if result.stderr else "Unknown error")
+                    rumps.notification("Digiman Monitor", "✗ SMART_PASTE failed", error.strip()[-100:] or "Unknown error")
             except Exception as e:
                 rumps.notification("Digiman Monitor", "✗ Error", str(e)[:100])
 
-            # Rebuild menu to show updated status
-            self.menu.clear()
-            self.build_menu()
+            # The job rewrote STATUS_FILE; the watcher already rebuilds on that
+            if not self.watching_status:
+                self.on_status_changed()
 
         threading.Thread(target=sync, daemon=True).start()
 
@@ -762,23 +1256,17 @@ class DigimanMonitor(rumps.App):
 
         def sync():
             try:
-                result = subprocess.run(
-                    [sys.executable, str(PROJECT_DIR / 'scripts' / 'nightly_sync.py')],
-                    capture_output=True,
-                    text=True,
-                    timeout=120,
-                    cwd=str(PROJECT_DIR)
-                )
-                if result.returncode == 0:
+                success, _, error = run_python_job('nightly')
+                if success:
                     rumps.notification("Digiman Monitor", "✓ Sync complete", "Check dashboard for details")
                 else:
-                    rumps.notification("Digiman Monitor", "✗ Sync failed", result.stderr[:100] if result.stderr else "Unknown error")
+                    rumps.notification("Digiman Monitor", "✗ Sync failed", error.strip()[-100:] or "Unknown error")
             except Exception as e:
                 rumps.notification("Digiman Monitor", "✗ Error", str(e)[:100])
 
-            # Rebuild menu to show updated status
-            self.menu.clear()
-            self.build_menu()
+            # The job rewrote STATUS_FILE; the watcher already rebuilds on that
+            if not self.watching_status:
+                self.on_status_changed()
 
         threading.Thread(target=sync, daemon=True).start()
 
@@ -2,79 +2,148 @@
 """Export Claude Code session to markdown. Called by Stop hook."""
 
 import json
+import os
 import re
 import sys
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
+try:
+    import orjson  # optional, faster JSON
+except ImportError:
+    orjson = None
+
+# Characters dropped from / whitespace collapsed in the filename topic
+NON_WORD_RE = re.compile(r'[^\w\s-]')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# The topic is taken from a user message within this many lines
+TOPIC_LINES = 100
+
+# Transcript entries that become markdown messages
+KEEP_TYPES = frozenset(('user', 'assistant'))
+
 def extract_text_from_content(content):
     """Extract text from content array (handles both string and dict items)."""
-    # Check if it's an array of single characters (streaming format)
-    if content and all(isinstance(c, str) and len(c) <= 2 for c in content[:100]):
+    if isinstance(content, str):
+        return content
+
+    # Check if it's an array of single characters (streaming format); the usual
+    # list of dicts is rejected on its first element without slicing
+    if content and isinstance(content[0], str) and all(
+        isinstance(c, str) and len(c) <= 2 for c in islice(content, 100)
+    ):
         return ''.join(content)
 
-    texts = []
-    for c in content:
-        if isinstance(c, str):
-            texts.append(c)
-        elif isinstance(c, dict) and c.get('type') == 'text':
-            texts.append(c.get('text', ''))
-    return ' '.join(texts)
-
-def extract_topic(lines):
-    """Extract topic from first meaningful user message."""
-    for line in lines[:100]:  # Check first 100 lines
+    return ' '.join(
+        c if isinstance(c, str) else c.get('text', '')
+        for c in content
+        if isinstance(c, str) or (isinstance(c, dict) and c.get('type') == 'text')
+    )
+
+def loads_line(line):
+    """Parse one JSONL line (bytes)."""
+    if orjson:
         try:
-            obj = json.loads(line)
-            if obj.get('type') == 'user':
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # e.g. invalid UTF-8; retry leniently below
+    return json.loads(line.decode('utf-8', 'ignore'))
+
+def topic_from_text(text):
+    """Turn a user message into a filename topic, or None if it isn't a real prompt."""
+    # Skip system messages, tool results, interrupts
+    if text and not text.startswith('[') and 'tool_result' not in text:
+        text = text[:60]
+        # Clean up for filename
+        topic = NON_WORD_RE.sub('', text)
+        topic = WHITESPACE_RE.sub('-', topic.strip())
+        return topic[:40].lower() or "session"
+    return None
+
+def unique_output_path(output_dir, day, topic):
+    """First free `<day>_<topic>[_N].md` path in output_dir."""
+    # One directory listing instead of a stat per candidate
+    with os.scandir(output_dir) as entries:
+        existing = {entry.name for entry in entries}
+    filename = f"{day}_{topic}.md"
+    counter = 1
+    while filename in existing:
+        filename = f"{day}_{topic}_{counter}.md"
+        counter += 1
+    return output_dir / filename
+
+def jsonl_to_markdown(jsonl_path, output_dir, now):
+    """Stream a JSONL transcript into a new markdown file in output_dir.
+
+    The filename and header need the topic, so messages are held in memory
+    only until it is known (at most TOPIC_LINES lines in); everything after
+    that is written as it is parsed. Returns the output path.
+    """
+    topic = None
+    pending = []
+    out = None
+
+    def open_output():
+        nonlocal out
+        path = unique_output_path(output_dir, now.strftime('%Y-%m-%d'), topic or "session")
+        out = open(path, 'wb', buffering=1 << 20)
+        out.write((
+            f"# Claude Code Session: {topic or 'session'}\n"
+            f"**Date:** {now.strftime('%Y-%m-%d %H:%M')}\n"
+            f"**Session:** `{jsonl_path.stem}`\n\n"
+            "---\n"
+        ).encode('utf-8'))
+        out.writelines(pending)
+        return path
+
+    try:
+        with jsonl_path.open('rb', buffering=1 << 20) as f:
+            for lineno, line in enumerate(f):
+                if out is None and (topic is not None or lineno >= TOPIC_LINES):
+                    output_path = open_output()
+
+                # Only JSON objects are messages; skip blank/partial lines without parsing
+                if line[:1] != b'{':
+                    continue
+                try:
+                    obj = loads_line(line)
+                except ValueError:
+                    continue
+
+                if obj.get('type') not in KEEP_TYPES:
+                    continue
+
+                ts = obj.get('timestamp', '')[:16].replace('T', ' ')
+                role = 'USER' if obj['type'] == 'user' else 'ASSISTANT'
+
                 msg = obj.get('message', {})
+                text = ""
                 if isinstance(msg, dict) and 'content' in msg:
-                    text = extract_text_from_content(msg['content'])
-                    # Skip system messages, tool results, interrupts
-                    if text and not text.startswith('[') and 'tool_result' not in text:
-                        text = text[:60]
-                        # Clean up for filename
-                        topic = re.sub(r'[^\w\s-]', '', text)
-                        topic = re.sub(r'\s+', '-', topic.strip())
-                        return topic[:40].lower() or "session"
-        except:
-            continue
-    return "session"
-
-def jsonl_to_markdown(jsonl_path):
-    """Convert JSONL transcript to markdown."""
-    lines = jsonl_path.read_text(encoding='utf-8', errors='ignore').splitlines()
-    topic = extract_topic(lines)
-
-    md = []
-    md.append(f"# Claude Code Session: {topic}")
-    md.append(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    md.append(f"**Session:** `{jsonl_path.stem}`\n")
-    md.append("---\n")
-
-    for line in lines:
-        try:
-            obj = json.loads(line)
-        except:
-            continue
-
-        if obj.get('type') not in ['user', 'assistant']:
-            continue
-
-        ts = obj.get('timestamp', '')[:16].replace('T', ' ')
-        role = 'USER' if obj['type'] == 'user' else 'ASSISTANT'
-
-        msg = obj.get('message', {})
-        text = ""
-        if isinstance(msg, dict) and 'content' in msg:
-            text = extract_text_from_content(msg['content'])
-
-        if text.strip():
-            md.append(f"## {role} ({ts})\n")
-            md.append(text.strip())
-            md.append("\n")
-
-    return '\n'.join(md), topic
+                    content = msg['content']
+                    # Plain-string content needs no extraction
+                    text = content if isinstance(content, str) else extract_text_from_content(content)
+
+                # Topic comes from the first meaningful user message in the first 100 lines
+                if topic is None and role == 'USER' and lineno < TOPIC_LINES:
+                    topic = topic_from_text(text)
+
+                text = text.strip()
+                if text:
+                    chunk = f"\n## {role} ({ts})\n\n{text}\n\n".encode('utf-8')
+                    if out is None:
+                        pending.append(chunk)
+                    else:
+                        out.write(chunk)
+
+        if out is None:
+            output_path = open_output()
+    finally:
+        if out is not None:
+            out.close()
+
+    return output_path
 
 def main():
     if len(sys.argv) < 2:
@@ -86,24 +155,12 @@ def main():
         print(f"File not found: {jsonl_path}")
         sys.exit(1)
 
-    markdown, topic = jsonl_to_markdown(jsonl_path)
-
     # Output path
     now = datetime.now()
     output_dir = Path.home() / "Downloads/MyNotes/06_Chat_Logs" / str(now.year) / f"{now.month:02d}"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    filename = f"{now.strftime('%Y-%m-%d')}_{topic}.md"
-    output_path = output_dir / filename
-
-    # Handle duplicates
-    counter = 1
-    while output_path.exists():
-        filename = f"{now.strftime('%Y-%m-%d')}_{topic}_{counter}.md"
-        output_path = output_dir / filename
-        counter += 1
-
-    output_path.write_text(markdown)
+    output_path = jsonl_to_markdown(jsonl_path, output_dir, now)
     print(f"Saved: {output_path}")
 
 if __name__ == "__main__":
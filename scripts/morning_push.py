@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Morning push script - Run at 8 AM via cron/launchd."""
 
+import random
+import socket
 import sys
 import time
 from pathlib import Path
@@ -11,6 +13,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from digiman.models import init_db
 from digiman.notifiers import SlackPusher
 
+# Seconds to wait after each failed attempt (plus up to 20% jitter)
+RETRY_DELAYS = (5, 15, 45)
+
+
+def dns_ready() -> bool:
+    """Cheap check that name resolution works again (it lags after Mac sleep)."""
+    try:
+        socket.gethostbyname("slack.com")
+        return True
+    except OSError:
+        return False
+
 
 def run_morning_push() -> bool:
     """Send morning briefing to Slack.
@@ -25,17 +39,19 @@ def run_morning_push() -> bool:
 
     # Send briefing with retry (DNS may not be ready after Mac sleep)
     pusher = SlackPusher()
-    max_attempts = 3
-    delay = 30
+    max_attempts = len(RETRY_DELAYS) + 1
 
     for attempt in range(1, max_attempts + 1):
-        success = pusher.send_briefing()
+        # Skip the Slack call (and its timeout) while DNS is still down
+        success = dns_ready() and pusher.send_briefing()
         if success:
             print(f"\n✅ Morning briefing sent! (attempt {attempt}/{max_attempts})")
             return True
 
         if attempt < max_attempts:
-            print(f"\n⚠️  Attempt {attempt}/{max_attempts} failed, retrying in {delay}s...")
+            delay = RETRY_DELAYS[attempt - 1]
+            delay += random.uniform(0, delay * 0.2)
+            print(f"\n⚠️  Attempt {attempt}/{max_attempts} failed, retrying in {delay:.0f}s...")
             time.sleep(delay)
 
     print("\n❌ Failed to send morning briefing after all attempts")
@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
 """Nightly sync script - Run at 11 PM via cron/launchd."""
 
+import gzip
+import io
 import sys
 import json
 import re
+import threading
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import date, datetime
+from datetime import datetime
+
+try:
+    import orjson  # optional, faster JSON
+except ImportError:
+    orjson = None
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -16,14 +25,38 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 STATUS_FILE = Path.home() / ".digiman" / "cron_status.json"
 
 from digiman.models import Todo, SyncHistory, init_db
+from digiman.cron_history import append_history
 from digiman.ingesters import GranolaIngester, SlackIngester
 from digiman.ingesters.meeting_archive import MeetingArchiveIngester
 from digiman.extractors import ActionExtractor
 
+# Sources sync in parallel; serialize their writes (suggestions and
+# processed markers) to SQLite
+_save_lock = threading.Lock()
+
+# Slack user mentions, e.g. <@U012AB3CD>
+MENTION_RE = re.compile(r'<@[A-Z0-9]+>')
+
+# Observations / summaries (not tasks); a tuple so startswith checks them in one call
+OBSERVATION_STARTERS = (
+    "strong performance", "good progress", "overall ", "in summary",
+    "key takeaway", "the team ", "discussion about", "talked about",
+    "no business topics", "no action items", "nothing to report",
+    "no updates", "general discussion", "status update",
+)
+
+# Titles that only report what happened in a meeting
+VAGUE_RE = re.compile(r'^(discussed|noted|mentioned|agreed|acknowledged)\b')
+
+
+# Line breaks/tabs become spaces, then runs of spaces collapse to one
+LINE_BREAKS = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+MULTI_SPACE_RE = re.compile(r" {2,}")
+
 
 def clean_text(text: str) -> str:
     """Clean text - remove newlines but preserve full content."""
-    return text.strip().replace("\n", " ").replace("  ", " ")
+    return MULTI_SPACE_RE.sub(" ", text.translate(LINE_BREAKS)).strip()
 
 
 def is_actionable(title: str) -> bool:
@@ -42,18 +75,11 @@ def is_actionable(title: str) -> bool:
         return False
 
     # Observations / summaries (not tasks)
-    observation_starters = [
-        "strong performance", "good progress", "overall ", "in summary",
-        "key takeaway", "the team ", "discussion about", "talked about",
-        "no business topics", "no action items", "nothing to report",
-        "no updates", "general discussion", "status update",
-    ]
-    for phrase in observation_starters:
-        if t.startswith(phrase):
-            return False
+    if t.startswith(OBSERVATION_STARTERS):
+        return False
 
     # Vague non-actionable patterns
-    if re.match(r'^(discussed|noted|mentioned|agreed|acknowledged)\b', t):
+    if VAGUE_RE.match(t):
         return False
 
     # Must start with a verb or contain actionable language
@@ -61,46 +87,43 @@ def is_actionable(title: str) -> bool:
     return True
 
 
-def run_sync(hours: int = 24) -> dict:
-    """Run the full sync process.
+class SectionOutput(io.TextIOBase):
+    """sys.stdout stand-in that buffers writes per capturing thread."""
 
-    Uses Granola's built-in action items (no AI extraction).
-    Captures Slack @mentions as todos directly.
+    def __init__(self, stream):
+        self.stream = stream
+        self._buffers = {}  # thread ident -> list of written strings
 
-    Args:
-        hours: Look back this many hours for new content
+    def writable(self):
+        return True
 
-    Returns:
-        Dict with sync statistics
-    """
-    print("🧠 Digiman Nightly Sync")
-    print("=" * 40)
+    def write(self, s):
+        buffer = self._buffers.get(threading.get_ident())
+        if buffer is None:
+            return self.stream.write(s)
+        buffer.append(s)
+        return len(s)
 
-    # Ensure database exists
-    init_db()
+    def flush(self):
+        self.stream.flush()
 
-    # Track stats
-    stats = {
-        "granola_processed": 0,
-        "granola_extracted": 0,
-        "meeting_archive_processed": 0,
-        "meeting_archive_extracted": 0,
-        "slack_processed": 0,
-        "slack_extracted": 0,
-        "errors": []
-    }
+    def capture(self, func, *args):
+        """Run func(*args), returning (everything it printed, its result)."""
+        ident = threading.get_ident()
+        self._buffers[ident] = buffer = []
+        try:
+            result = func(*args)
+        finally:
+            del self._buffers[ident]
+        return "".join(buffer), result
 
-    # Start sync record
-    sync_id = SyncHistory.start("full")
 
-    # Initialize ingesters and extractors
+def _sync_granola(hours: int) -> dict:
+    """Turn recent Granola meetings into suggestions."""
+    stats = {"granola_processed": 0, "granola_extracted": 0, "errors": []}
     granola = GranolaIngester()
-    slack = SlackIngester()
     extractor = ActionExtractor()
 
-    today = date.today().isoformat()
-
-    # ========== Granola Sync ==========
     print("\n📝 Processing Granola meetings...")
     try:
         meetings = granola.get_recent_meetings(hours=hours)
@@ -132,8 +155,8 @@ def run_sync(hours: int = 24) -> dict:
                             for item in regex_items
                         ]
 
-                # Save filtered results
-                saved = 0
+                # Save filtered results (one transaction per meeting)
+                pending = []
                 for item in ai_items:
                     title = clean_text(item.get("title", "") if isinstance(item, dict) else str(item))
                     if not title or not is_actionable(title):
@@ -160,9 +183,12 @@ def run_sync(hours: int = 24) -> dict:
                         is_suggestion=True,
                         extraction_confidence=item.get("confidence", 0.8) if isinstance(item, dict) else 0.6,
                     )
-                    suggestion.save()
-                    saved += 1
-                    stats["granola_extracted"] += 1
+                    pending.append(suggestion)
+
+                with _save_lock:
+                    Todo.bulk_save(pending)
+                saved = len(pending)
+                stats["granola_extracted"] += saved
 
                 if saved:
                     source = "AI" if content.strip() else "regex"
@@ -171,7 +197,8 @@ def run_sync(hours: int = 24) -> dict:
                     print(f"   ○ {meeting['title']}: no actionable items found, skipping")
 
                 # Mark as processed
-                granola.mark_processed(meeting["id"])
+                with _save_lock:
+                    granola.mark_processed(meeting["id"])
                 stats["granola_processed"] += 1
 
             except Exception as e:
@@ -184,7 +211,13 @@ def run_sync(hours: int = 24) -> dict:
         print(f"   ❌ {error}")
         stats["errors"].append(error)
 
-    # ========== Meeting Archive Sync (SMART_PASTE processed files) ==========
+    return stats
+
+
+def _sync_meeting_archive(hours: int) -> dict:
+    """Turn SMART_PASTE processed meeting files into suggestions."""
+    stats = {"meeting_archive_processed": 0, "meeting_archive_extracted": 0, "errors": []}
+
     print("\n📂 Processing SMART_PASTE meeting archive...")
     try:
         archive = MeetingArchiveIngester()
@@ -195,6 +228,7 @@ def run_sync(hours: int = 24) -> dict:
             try:
                 action_items = meeting.get("action_items", [])
 
+                pending = []
                 for item in action_items:
                     title = item.get("title", "")
                     if not title:
@@ -214,12 +248,16 @@ def run_sync(hours: int = 24) -> dict:
                         is_suggestion=True,
                         extraction_confidence=item.get("confidence", 0.9)
                     )
-                    suggestion.save()
-                    stats["meeting_archive_extracted"] += 1
+                    pending.append(suggestion)
+
+                with _save_lock:
+                    Todo.bulk_save(pending)
+                stats["meeting_archive_extracted"] += len(pending)
 
                 print(f"   ✓ {meeting['title']}: {len(action_items)} structured action items")
 
-                archive.mark_processed(meeting["id"])
+                with _save_lock:
+                    archive.mark_processed(meeting["id"])
                 stats["meeting_archive_processed"] += 1
 
             except Exception as e:
@@ -232,7 +270,14 @@ def run_sync(hours: int = 24) -> dict:
         print(f"   ❌ {error}")
         stats["errors"].append(error)
 
-    # ========== Slack Sync ==========
+    return stats
+
+
+def _sync_slack(hours: int) -> dict:
+    """Turn recent Slack @mentions into suggestions."""
+    stats = {"slack_processed": 0, "slack_extracted": 0, "errors": []}
+    slack = SlackIngester()
+
     print("\n💬 Processing Slack mentions...")
     try:
         mentions = slack.get_recent_mentions(hours=hours)
@@ -256,6 +301,7 @@ def run_sync(hours: int = 24) -> dict:
 
                 if action_items:
                     # Create suggestions from extracted action items
+                    pending = []
                     for item in action_items:
                         item_clean = clean_text(item)
                         if not item_clean or len(item_clean) < 5:
@@ -275,16 +321,18 @@ def run_sync(hours: int = 24) -> dict:
                             source_url=mention.get("permalink"),
                             is_suggestion=True,
                         )
-                        suggestion.save()
-                        stats["slack_extracted"] += 1
+                        pending.append(suggestion)
+
+                    with _save_lock:
+                        Todo.bulk_save(pending)
+                    stats["slack_extracted"] += len(pending)
 
                     print(f"   ✓ #{channel_name} ({context_type}): {len(action_items)} action items extracted")
                 else:
                     # No action items found - create a review suggestion with full context
                     text = mention.get("text", "")
-                    import re
                     # Remove user mentions for clean title
-                    cleaned = re.sub(r'<@[A-Z0-9]+>', '', text)
+                    cleaned = MENTION_RE.sub('', text)
                     cleaned = clean_text(cleaned)
 
                     username = mention.get("username", "")
@@ -304,12 +352,14 @@ def run_sync(hours: int = 24) -> dict:
                         source_url=mention.get("permalink"),
                         is_suggestion=True,
                     )
-                    suggestion.save()
+                    with _save_lock:
+                        suggestion.save()
                     stats["slack_extracted"] += 1
                     print(f"   ○ #{channel_name} ({context_type}): no actions found, created review suggestion")
 
                 # Mark as processed
-                slack.mark_processed(mention["id"])
+                with _save_lock:
+                    slack.mark_processed(mention["id"])
                 stats["slack_processed"] += 1
 
             except Exception as e:
@@ -322,6 +372,59 @@ def run_sync(hours: int = 24) -> dict:
         print(f"   ❌ {error}")
         stats["errors"].append(error)
 
+    return stats
+
+
+def run_sync(hours: int = 24) -> dict:
+    """Run the full sync process.
+
+    Uses Granola's built-in action items (no AI extraction).
+    Captures Slack @mentions as todos directly.
+
+    Args:
+        hours: Look back this many hours for new content
+
+    Returns:
+        Dict with sync statistics
+    """
+    print("🧠 Digiman Nightly Sync")
+    print("=" * 40)
+
+    # Ensure database exists
+    init_db()
+
+    # Track stats
+    stats = {
+        "granola_processed": 0,
+        "granola_extracted": 0,
+        "meeting_archive_processed": 0,
+        "meeting_archive_extracted": 0,
+        "slack_processed": 0,
+        "slack_extracted": 0,
+        "errors": []
+    }
+
+    # Start sync record
+    sync_id = SyncHistory.start("full")
+
+    # The sources are independent and mostly wait on network/disk, so fetch
+    # them in parallel. Each section's output (including what the ingesters
+    # print) is buffered so the log reads in order.
+    sections = (_sync_granola, _sync_meeting_archive, _sync_slack)
+    output = SectionOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(sections)) as pool:
+            futures = [pool.submit(output.capture, section, hours) for section in sections]
+    finally:
+        sys.stdout = output.stream
+
+    for future in futures:
+        text, section_stats = future.result()
+        print(text, end="")
+        for key, value in section_stats.items():
+            stats[key] += value
+
     # Complete sync record
     total_processed = stats["granola_processed"] + stats["meeting_archive_processed"] + stats["slack_processed"]
     total_extracted = stats["granola_extracted"] + stats["meeting_archive_extracted"] + stats["slack_extracted"]
@@ -382,15 +485,17 @@ def push_to_cloud():
             print("   No pending suggestions to push")
             return
 
-        payload = json.dumps({
+        # Descriptions are free text and compress well; the server inflates the body
+        payload = gzip.compress(json.dumps({
             "suggestions": [s.to_dict() for s in suggestions]
-        }).encode("utf-8")
+        }).encode("utf-8"), compresslevel=6)
 
         req = urllib.request.Request(
             f"{app_url}/api/suggestions/import",
             data=payload,
             headers={
                 "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
                 "X-Deploy-Token": deploy_secret,
             },
             method="POST",
@@ -419,9 +524,9 @@ def update_status_file(stats, total_extracted):
         status = {}
         if STATUS_FILE.exists():
             try:
-                status = json.loads(STATUS_FILE.read_text())
-            except:
-                pass
+                status = orjson.loads(STATUS_FILE.read_bytes()) if orjson else json.loads(STATUS_FILE.read_bytes())
+            except ValueError:
+                pass  # corrupt or half-written; start fresh
 
         # Update status
         now = datetime.now().isoformat()
@@ -437,16 +542,14 @@ def update_status_file(stats, total_extracted):
             sources.append("Slack")
         status["sources"] = sources
 
-        # Add to history
-        history = status.get("history", [])
-        history.insert(0, {
+        # Add to history (appended to the sidecar, not kept in the status file)
+        append_history({
             "timestamp": now,
             "status": "success" if not stats["errors"] else "error",
             "count": total_extracted,
             "source": "nightly_sync",
             "error": stats["errors"][0] if stats["errors"] else None
-        })
-        status["history"] = history[:50]  # Keep last 50 entries
+        }, legacy=status.pop("history", None))
 
         # Check integrations
         from digiman.config import SLACK_BOT_TOKEN, GRANOLA_CACHE_PATH
@@ -455,7 +558,7 @@ def update_status_file(stats, total_extracted):
         status["morning_push_enabled"] = bool(SLACK_BOT_TOKEN)
 
         # Write status
-        STATUS_FILE.write_text(json.dumps(status, indent=2))
+        STATUS_FILE.write_bytes(orjson.dumps(status) if orjson else json.dumps(status).encode("utf-8"))
 
     except Exception as e:
         print(f"Warning: Could not update status file: {e}")
@@ -18,6 +18,11 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from digiman.cron_history import append_history, read_history
+
 # Configuration
 GRANOLA_CACHE_PATH = Path.home() / "Library/Application Support/Granola/cache-v3.json"
 MYNOTES_PATH = Path.home() / "Downloads/MyNotes"
@@ -104,6 +109,7 @@ def sync_status_to_pythonanywhere():
             return
 
         status_data = json.loads(STATUS_FILE.read_text())
+        status_data["history"] = read_history()
 
         # Send to PythonAnywhere
         url = f"https://{username}.pythonanywhere.com/api/monitoring/status"
@@ -170,17 +176,14 @@ def update_dashboard_status(job_name: str, status: str, count: int = 0, message:
                 sources.append("SMART_PASTE")
             data["sources"] = sources
 
-        # Add to history
-        if "history" not in data:
-            data["history"] = []
-        data["history"].insert(0, {
+        # Add to history (appended to the sidecar, not kept in the status file)
+        append_history({
             "timestamp": now,
             "source": job_name,
             "status": status,
             "count": count,
             "error": message if status == "error" else None
-        })
-        data["history"] = data["history"][:50]  # Keep last 50
+        }, legacy=data.pop("history", None))
 
         # Update backfill status
         state = load_state()
@@ -196,7 +199,7 @@ def update_dashboard_status(job_name: str, status: str, count: int = 0, message:
             "last_check": now
         }
 
-        STATUS_FILE.write_text(json.dumps(data, indent=2))
+        STATUS_FILE.write_text(json.dumps(data))
 
     except Exception as e:
         log(f"Warning: Could not update dashboard status: {e}")
@@ -17,6 +17,22 @@ class TestTodoAPI:
         assert isinstance(data, list)
         assert len(data) >= 1
 
+    def test_get_todos_filtered(self, client, sample_todo):
+        """Test GET /api/todos filters by due_date and status."""
+        response = client.get('/api/todos?due_date=2026-01-29&status=pending')
+        assert [t['id'] for t in json.loads(response.data)] == [sample_todo.id]
+
+        response = client.get('/api/todos?due_date=2026-01-30&status=pending')
+        assert json.loads(response.data) == []
+
+    def test_get_todos_conditional(self, client, sample_todo):
+        """Test GET /api/todos answers 304 when the ETag still matches."""
+        etag = client.get('/api/todos').headers['ETag']
+
+        response = client.get('/api/todos', headers={'If-None-Match': etag})
+
+        assert response.status_code == 304
+
     def test_create_todo(self, client, test_db):
         """Test POST /api/todos creates a todo."""
         response = client.post('/api/todos',
@@ -154,6 +170,31 @@ class TestSuggestionAPI:
         assert response.status_code == 404  # Not a suggestion
 
 
+class TestImportSuggestionsAPI:
+    """Tests for the bulk suggestion import endpoint."""
+
+    def test_import_gzip_body(self, client, test_db, monkeypatch):
+        """Test that a gzip-encoded JSON body is inflated and imported."""
+        import gzip
+        from digiman import app as app_module
+        from digiman.models import Todo
+        monkeypatch.setattr(app_module, "DEPLOY_SECRET", "secret")
+
+        body = json.dumps({"suggestions": [
+            {"title": "Send the launch checklist to the team", "source_type": "slack", "source_id": "C1_1"}
+        ]}).encode("utf-8")
+        response = client.post(
+            '/api/suggestions/import',
+            data=gzip.compress(body),
+            content_type='application/json',
+            headers={'Content-Encoding': 'gzip', 'X-Deploy-Token': 'secret'}
+        )
+
+        assert response.status_code == 200
+        assert json.loads(response.data)['imported'] == 1
+        assert [s.title for s in Todo.get_suggestions()] == ["Send the launch checklist to the team"]
+
+
 class TestHomepage:
     """Tests for homepage rendering."""
 
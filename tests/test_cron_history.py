@@ -0,0 +1,39 @@
+"""Tests for the cron run history sidecar."""
+
+from digiman import cron_history
+from digiman.cron_history import append_history, read_history
+
+
+class TestCronHistory:
+    """Tests for append_history / read_history."""
+
+    def test_append_and_read_newest_first(self, tmp_path):
+        """Test that runs are read back newest first and capped at the limit."""
+        path = tmp_path / "cron_history.jsonl"
+        for i in range(5):
+            append_history({"source": "nightly_sync", "count": i}, path=path)
+
+        assert [e["count"] for e in read_history(path=path)] == [4, 3, 2, 1, 0]
+        assert [e["count"] for e in read_history(limit=2, path=path)] == [4, 3]
+        assert read_history(path=tmp_path / "missing.jsonl") == []
+
+    def test_legacy_history_seeds_new_file(self, tmp_path):
+        """Test that an old newest-first history list is carried over once."""
+        path = tmp_path / "cron_history.jsonl"
+        legacy = [{"count": 2}, {"count": 1}]
+
+        append_history({"count": 3}, legacy=legacy, path=path)
+        append_history({"count": 4}, legacy=legacy, path=path)
+
+        assert [e["count"] for e in read_history(path=path)] == [4, 3, 2, 1]
+
+    def test_file_is_trimmed_when_large(self, tmp_path, monkeypatch):
+        """Test that the file is rewritten with the last runs once it grows too big."""
+        path = tmp_path / "cron_history.jsonl"
+        monkeypatch.setattr(cron_history, "HISTORY_MAX_BYTES", 200)
+
+        for i in range(cron_history.HISTORY_LIMIT + 10):
+            append_history({"count": i}, path=path)
+
+        assert len(path.read_bytes().splitlines()) == cron_history.HISTORY_LIMIT
+        assert read_history(path=path)[0]["count"] == cron_history.HISTORY_LIMIT + 9
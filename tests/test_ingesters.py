@@ -133,10 +133,7 @@ class TestSyncScript:
         result = clean_text(text)
 
         assert "\n" not in result
-        # clean_text replaces newlines and double spaces but may leave some spaces
-        assert "Hello" in result
-        assert "World" in result
-        assert "Test" in result
+        assert result == "Hello World Test"
 
     def test_clean_text_preserves_content(self, test_db):
         """Test that clean_text doesn't truncate."""
@@ -3,7 +3,7 @@
 import pytest
 from datetime import date, timedelta
 
-from digiman.models import Todo, SyncHistory, ProcessedSource
+from digiman.models import Todo, TodoView, SyncHistory, ProcessedSource
 
 
 class TestTodoModel:
@@ -135,6 +135,29 @@ class TestTodoModel:
         assert all(s.is_suggestion for s in suggestions)
         assert "Regular todo" not in suggestion_titles
 
+    def test_read_paths_return_views(self, sample_todo):
+        """Test that list queries return read-only TodoView snapshots."""
+        todos = Todo.get_all()
+
+        assert len(todos) == 1
+        assert isinstance(todos[0], TodoView)
+        assert todos[0].to_dict() == sample_todo.to_dict() | {
+            "created_at": todos[0].created_at,
+            "updated_at": todos[0].updated_at,
+        }
+
+    def test_get_calendar_data(self, test_db):
+        """Test calendar data groups dated todos, parses tags and flags overdue."""
+        Todo(title="Tagged", timeline_type="date", due_date="2020-02-03", tags=["work"]).save()
+        Todo(title="Someday", timeline_type="backlog").save()
+
+        data = Todo.get_calendar_data(2020, 2)
+
+        assert [t.title for t in data["by_date"]["2020-02-03"]] == ["Tagged"]
+        assert data["by_date"]["2020-02-03"][0].tags == ["work"]
+        assert data["by_date"]["2020-02-03"][0].is_overdue is True
+        assert [t.title for t in data["backlog"]] == ["Someday"]
+
     def test_overdue_detection(self, test_db):
         """Test overdue todo detection."""
         yesterday = (date.today() - timedelta(days=1)).isoformat()
@@ -152,6 +175,28 @@ class TestTodoModel:
 
         assert len(result["overdue"]) == 1
         assert result["overdue"][0].title == "Overdue task"
+        assert result["overdue"][0].is_overdue == True
+        assert result["overdue"][0].days_overdue == 1
+        assert Todo.get_by_id(todo.id).days_overdue == 1
+
+    def test_get_today_sections(self, test_db):
+        """Test that get_today() buckets todos into every section."""
+        today = date.today().isoformat()
+        current_week = date.today().isocalendar()
+        week_str = f"{current_week[0]}-W{current_week[1]:02d}"
+
+        Todo(title="Today task", timeline_type="date", due_date=today).save()
+        Todo(title="Week task", timeline_type="week", due_week=week_str).save()
+        done = Todo(title="Done task", timeline_type="date", due_date=today)
+        done.save()
+        done.complete()
+
+        result = Todo.get_today()
+
+        assert [t.title for t in result["today"]] == ["Today task"]
+        assert [t.title for t in result["this_week"]] == ["Week task"]
+        assert [t.title for t in result["completed"]] == ["Done task"]
+        assert result["overdue"] == []
 
     def test_source_tracking(self, test_db):
         """Test that source_id and source_type are stored correctly."""
@@ -170,6 +215,21 @@ class TestTodoModel:
         assert fetched.source_id == "C123_1234567890.123456"
         assert fetched.source_context == "#general"
 
+    def test_bulk_save(self, test_db):
+        """Test inserting many suggestions in one call."""
+        todos = [
+            Todo(title=f"Item {i}", source_type="granola", source_id="m_1", is_suggestion=True)
+            for i in range(3)
+        ]
+
+        ids = Todo.bulk_save(todos)
+
+        assert ids == [t.id for t in todos]
+        assert all(ids)
+        suggestions = sorted(Todo.get_suggestions(), key=lambda s: s.id)
+        assert [s.title for s in suggestions] == ["Item 0", "Item 1", "Item 2"]
+        assert Todo.bulk_save([]) == []
+
 
 class TestSyncHistory:
     """Tests for SyncHistory model."""
@@ -212,3 +272,31 @@ class TestProcessedSource:
         # Different source should not be processed
         assert ProcessedSource.is_processed("slack", "msg_456") == False
         assert ProcessedSource.is_processed("granola", "msg_123") == False
+
+    def test_load_all_and_bulk_mark(self, test_db):
+        """Test loading processed pairs and marking many at once."""
+        ProcessedSource.mark_processed("slack", "msg_1")
+        ProcessedSource.bulk_mark([("granola", "m_1"), ("granola", "m_2"), ("slack", "msg_1")])
+
+        processed = ProcessedSource.load_all()
+
+        assert processed == {("slack", "msg_1"), ("granola", "m_1"), ("granola", "m_2")}
+
+
+class TestSchemaMigrations:
+    """Tests for schema migrations."""
+
+    def test_migrations_record_schema_version(self, test_db):
+        """Test that init_db stamps user_version and is safe to rerun."""
+        from digiman.models import get_db, init_db
+        from digiman.models.todo import SCHEMA_VERSION
+
+        init_db()
+
+        with get_db() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            columns = [col[1] for col in conn.execute("PRAGMA table_info(todos)").fetchall()]
+
+        assert version == SCHEMA_VERSION
+        assert "is_suggestion" in columns
+        assert "tags" in columns